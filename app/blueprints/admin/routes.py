@@ -4,8 +4,8 @@ import math
 import os
 from urllib.parse import urlparse
 
-from flask import Blueprint, Response, redirect, render_template, request, url_for
-from flask_babel import _
+from flask import Blueprint, Response, g, redirect, render_template, request, url_for
+from flask_babel import _, get_locale
 from flask_login import login_required
 
 from app.decorators import admin_required, guest_allowed, permission_required
@@ -844,11 +844,18 @@ def edit_identity(identity_id):
     return render_template("modals/edit-identity.html", identity=identity)
 
 
-# HTMX endpoint for latest accepted invitations card
-@admin_bp.route("/accepted-invites-card")
-@login_required
-def accepted_invites_card():
-    """Return a paginated card with the most recent accepted invitations."""
+def _accepted_invites_context() -> dict:
+    """Load the accepted-invites card's data, once per request.
+
+    Both the card's ETag token and the view itself read it, so a request that
+    is answered with a 200 still queries the database only once. The entry is
+    tied to the request: ``g`` lives as long as the app context, which may
+    serve several requests when one was already pushed.
+    """
+    current = request._get_current_object()
+    memo = g.get("accepted_invites_context")
+    if memo is not None and memo[0] is current:
+        return memo[1]
 
     page = request.args.get("page", default=1, type=int) or 1
     if page < 1:
@@ -905,16 +912,49 @@ def accepted_invites_card():
     start_index = offset + 1 if total else 0
     end_index = offset + len(invites)
 
+    context = {
+        "invites": invites,
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "total_pages": total_pages,
+        "start_index": start_index,
+        "end_index": end_index,
+        "server_count": server_count,
+    }
+    g.accepted_invites_context = (current, context)
+    return context
+
+
+def _accepted_invites_version() -> str:
+    """ETag token covering everything the accepted-invites card renders."""
+    context = _accepted_invites_context()
+    rows = [
+        (
+            inv.id,
+            inv.used_at,
+            inv.created,
+            [
+                (user.id, user.username, user.photo, user.server and user.server.name)
+                for user in inv.get_all_users()
+            ],
+        )
+        for inv in context["invites"]
+    ]
+    pages = (context["page"], context["per_page"], context["total"])
+    return repr((str(get_locale()), pages, rows))
+
+
+# HTMX endpoint for latest accepted invitations card
+@admin_bp.route("/accepted-invites-card")
+@permission_required("view_invites", etag_fn=_accepted_invites_version)
+def accepted_invites_card():
+    """Return a paginated card with the most recent accepted invitations.
+
+    The dashboard polls this card; unchanged data is answered with a 304.
+    """
     return render_template(
-        "admin/accepted_invites_card.html",
-        invites=invites,
-        page=page,
-        per_page=per_page,
-        total=total,
-        total_pages=total_pages,
-        start_index=start_index,
-        end_index=end_index,
-        server_count=server_count,
+        "admin/accepted_invites_card.html", **_accepted_invites_context()
     )
 
 
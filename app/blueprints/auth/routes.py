@@ -53,11 +53,10 @@ def login():
     if account := AdminAccount.query.filter_by(username=username).first():
         if account.jellyfin_server:
             # This is a Jellyfin-linked account, try Jellyfin authentication
-            from app.services.jellyfin_auth import authenticate_jellyfin_user
+            from app.services.jellyfin_auth import login_or_create_guest
             
             try:
-                success, server_name, user_info = authenticate_jellyfin_user(username, password)
-                if success and server_name == account.jellyfin_server:
+                if account := login_or_create_guest(username, password):
                     login_user(account, remember=bool(request.form.get("remember")))
                     return redirect("/")
             except Exception as e:
@@ -83,13 +82,11 @@ def login():
     # ── 4) New Jellyfin user authentication and account creation ────
     # If no local account exists, try Jellyfin authentication
     if not AdminAccount.query.filter_by(username=username).first():
-        from app.services.jellyfin_auth import authenticate_jellyfin_user, create_guest_account_from_jellyfin
+        from app.services.jellyfin_auth import login_or_create_guest
         
         try:
-            success, server_name, user_info = authenticate_jellyfin_user(username, password)
-            if success:
-                # Create a new guest account for this Jellyfin user
-                account = create_guest_account_from_jellyfin(username, server_name, user_info)
+            # Creates a new guest account for this Jellyfin user
+            if account := login_or_create_guest(username, password):
                 login_user(account, remember=bool(request.form.get("remember")))
                 logging.info(f"Created and logged in new guest account for Jellyfin user '{username}'")
                 return redirect("/")
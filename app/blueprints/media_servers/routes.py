@@ -445,49 +445,55 @@ def get_statistics_by_type(server_type):
 @admin_required
 def get_all_health():
     """Return lightweight health statistics for all servers without triggering user sync."""
+    from app.services.media.service import call_on_clients, get_media_client
+
     servers = MediaServer.query.all()
     all_health = {}
 
+    def failed(server_data, error):
+        return {
+            "error": error,
+            **server_data,
+            "user_stats": {"total_users": 0, "active_sessions": 0},
+            "server_stats": {"version": "Unknown", "transcoding_sessions": 0},
+            "library_stats": {},
+            "content_stats": {},
+        }
+
+    polled = []  # (server_data, client) pairs queried concurrently below
     for server in servers:
         # Extract server data before making client calls to avoid session corruption
         server_data = {
-            "id": server.id,
-            "name": server.name,
+            "server_name": server.name,
             "server_type": server.server_type,
+            "server_id": server.id,
         }
 
         try:
-            from app.services.media.service import get_media_client
-
-            client = get_media_client(server_data["server_type"], media_server=server)
-            if client:
-                # Use lightweight readonly statistics instead of full statistics
-                stats = client.get_readonly_statistics()
-                stats["server_name"] = server_data["name"]
-                stats["server_type"] = server_data["server_type"]
-                stats["server_id"] = server_data["id"]
-                all_health[server_data["id"]] = stats
-            else:
-                all_health[server_data["id"]] = {
-                    "error": f"No client available for server type: {server_data['server_type']}",
-                    "server_name": server_data["name"],
-                    "server_type": server_data["server_type"],
-                    "server_id": server_data["id"],
-                    "user_stats": {"total_users": 0, "active_sessions": 0},
-                    "server_stats": {"version": "Unknown", "transcoding_sessions": 0},
-                    "library_stats": {},
-                    "content_stats": {},
-                }
+            client = get_media_client(server.server_type, media_server=server)
         except Exception as e:
-            all_health[server_data["id"]] = {
-                "error": f"Failed to get health: {str(e)}",
-                "server_name": server_data["name"],
-                "server_type": server_data["server_type"],
-                "server_id": server_data["id"],
-                "user_stats": {"total_users": 0, "active_sessions": 0},
-                "server_stats": {"version": "Unknown", "transcoding_sessions": 0},
-                "library_stats": {},
-                "content_stats": {},
-            }
+            all_health[server.id] = failed(server_data, f"Failed to get health: {e}")
+            continue
+
+        if client:
+            polled.append((server_data, client))
+        else:
+            all_health[server.id] = failed(
+                server_data,
+                f"No client available for server type: {server.server_type}",
+            )
+
+    # Use lightweight readonly statistics instead of full statistics
+    results = call_on_clients(
+        [client for _, client in polled], "get_readonly_statistics"
+    )
+    for (server_data, _), stats in zip(polled, results, strict=True):
+        if isinstance(stats, Exception):
+            all_health[server_data["server_id"]] = failed(
+                server_data, f"Failed to get health: {stats}"
+            )
+        else:
+            stats.update(server_data)
+            all_health[server_data["server_id"]] = stats
 
     return jsonify(all_health)
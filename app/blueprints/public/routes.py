@@ -223,7 +223,6 @@ def cinema_posters():
         from flask import current_app
 
         from app.models import MediaServer
-        from app.services.media.service import get_client_for_media_server
 
         # Cache key for poster URLs
         cache_key = "cinema_posters"
@@ -242,7 +241,7 @@ def cinema_posters():
             return jsonify([])
 
         # Get media client for the server
-        client = get_client_for_media_server(server)
+        client = server.client
 
         # Check if client has get_movie_posters method
         poster_urls = []
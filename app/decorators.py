@@ -4,80 +4,146 @@ Permission decorators for role-based access control.
 This module provides decorators to restrict access to routes based on admin account roles.
 """
 
+import hashlib
 from functools import wraps
-from flask import abort, current_app
-from flask_login import current_user, login_required
+from flask import abort, current_app, g, make_response, request
+from flask_login import current_user
 
+# Session id used by the legacy single-admin (Settings table) login
+LEGACY_ADMIN_ID = "admin"
 
-def admin_required(f):
-    """Decorator that requires admin role.
-    
-    Can be used in combination with @login_required or standalone (it includes login check).
+# Role flags precomputed once per loaded user (see ``compute_role_bits``)
+ROLE_LEGACY_ADMIN = 1
+ROLE_ADMIN = 2
+ROLE_ACCOUNT = 4
+
+
+def compute_role_bits(user) -> int:
+    """Collapse the role probes the decorators need into a single bitset."""
+    bits = 0
+    if getattr(user, "id", None) == LEGACY_ADMIN_ID:
+        bits |= ROLE_LEGACY_ADMIN | ROLE_ADMIN
+    elif _call_flag(user, "is_admin"):
+        bits |= ROLE_ADMIN
+    if hasattr(user, "role"):
+        bits |= ROLE_ACCOUNT
+    return bits
+
+
+def _role_bits(user) -> int:
+    bits = getattr(user, "_role_bits", None)
+    if bits is None:
+        # Users not produced by the login manager's loader (e.g. tests)
+        bits = compute_role_bits(user)
+    return bits
+
+
+def _cached_check(user, key, check):
+    """Evaluate *check* once per request for *user* and *key*.
+
+    Results are memoised on ``flask.g`` so stacked decorators (and repeated
+    checks from the same view) don't re-run role lookups.
     """
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        # First ensure user is logged in
-        if not current_user.is_authenticated:
-            return current_app.login_manager.unauthorized()
-        
-        # Check if user has admin role
-        if hasattr(current_user, 'is_admin') and current_user.is_admin():
-            return f(*args, **kwargs)
-        
-        # For legacy AdminUser (single admin), allow access
-        if hasattr(current_user, 'id') and current_user.id == 'admin':
-            return f(*args, **kwargs)
-            
-        # Deny access
-        abort(403)
-        
-    return decorated_function
-
-
-def permission_required(permission):
-    """Decorator that requires a specific permission.
-    
-    Args:
-        permission (str): The permission name to check (e.g., 'manage_users', 'create_invites')
+    cache = g.setdefault("_perm_cache", {})
+    cache_key = (getattr(user, "id", None), key)
+    if cache_key not in cache:
+        cache[cache_key] = check()
+    return cache[cache_key]
+
+
+def _call_flag(user, name, *args) -> bool:
+    """Call the role helper *name* on *user* if it exists, otherwise ``False``.
+
+    Non-callable attributes (e.g. the ``User.is_admin`` column) are not role
+    helpers and never grant access.
+    """
+    method = getattr(user, name, None)
+    if not callable(method):
+        return False
+    return bool(method(*args))
+
+
+def _conditional_response(user, etag_fn, view, *args, **kwargs):
+    """Serve *view* with an ETag, answering 304 when the client's copy is current.
+
+    The tag covers the user, the request URL and ``etag_fn()`` - a cheap token
+    the view supplies that changes whenever its output would.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return view(*args, **kwargs)
+
+    token = f"{user.get_id()}|{etag_fn()}|{request.url}"
+    etag = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(view(*args, **kwargs))
+    response.set_etag(etag)
+    # Per-user content: browsers may keep it but must revalidate every time
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _require(check, etag_fn=None):
+    """Build a decorator that lets the request through when ``check(user)`` holds.
+
+    Unauthenticated users are sent to the login manager, everyone else who
+    fails *check* gets a 403. With *etag_fn*, GET responses carry an ETag and
+    matching ``If-None-Match`` requests get a 304 without running the view.
     """
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # First ensure user is logged in
-            if not current_user.is_authenticated:
+            user = current_user._get_current_object()
+            if not user.is_authenticated:
                 return current_app.login_manager.unauthorized()
-            
-            # Check if user has the required permission
-            if hasattr(current_user, 'has_permission') and current_user.has_permission(permission):
-                return f(*args, **kwargs)
-            
-            # For legacy AdminUser (single admin), allow all permissions
-            if hasattr(current_user, 'id') and current_user.id == 'admin':
+            if not check(user):
+                abort(403)
+            if etag_fn is None:
                 return f(*args, **kwargs)
-                
-            # Deny access
-            abort(403)
-            
+            return _conditional_response(user, etag_fn, f, *args, **kwargs)
+
         return decorated_function
     return decorator
 
 
+def _admin_check(user) -> bool:
+    return bool(_role_bits(user) & ROLE_ADMIN)
+
+
+def _guest_check(user) -> bool:
+    return bool(_role_bits(user) & (ROLE_LEGACY_ADMIN | ROLE_ACCOUNT))
+
+
+def admin_required(f):
+    """Decorator that requires admin role.
+
+    Can be used in combination with @login_required or standalone (it includes login check).
+    """
+    return _require(_admin_check)(f)
+
+
+def permission_required(permission, etag_fn=None):
+    """Decorator that requires a specific permission.
+
+    Args:
+        permission (str): The permission name to check (e.g., 'manage_users', 'create_invites')
+        etag_fn (callable, optional): Returns a version token for the view's
+            data; enables ETag / 304 handling for GET requests
+    """
+    def check(user) -> bool:
+        # Admins (legacy or not) hold every permission
+        return bool(_role_bits(user) & ROLE_ADMIN) or _cached_check(
+            user, permission, lambda: _call_flag(user, "has_permission", permission)
+        )
+
+    return _require(check, etag_fn)
+
+
 def guest_allowed(f):
     """Decorator that allows both admin and guest roles.
-    
+
     This is for routes that guests should be able to access (like creating invites).
     """
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        # First ensure user is logged in
-        if not current_user.is_authenticated:
-            return current_app.login_manager.unauthorized()
-        
-        # Allow access for any authenticated admin account or legacy admin
-        if hasattr(current_user, 'role') or (hasattr(current_user, 'id') and current_user.id == 'admin'):
-            return f(*args, **kwargs)
-            
-        # Deny access
-        abort(403)
-        
-    return decorated_function
\ No newline at end of file
+    return _require(_guest_check)(f)
@@ -144,20 +144,26 @@ def load_user(user_id):
     2. A decimal string – primary key of an ``AdminAccount`` row.
     """
 
+    from .decorators import compute_role_bits
     from .models import (  # imported lazily to avoid circular deps
         AdminAccount,
         AdminUser,
     )
 
+    user = None
+
     # ── legacy single-admin token ───────────────────────────────────────────
     if user_id == "admin":
-        return AdminUser()
+        user = AdminUser()
 
     # ── new multi-admin accounts ───────────────────────────────────────────
-    if user_id.isdigit():
-        return AdminAccount.query.get(int(user_id))
+    elif user_id.isdigit():
+        user = AdminAccount.query.get(int(user_id))
 
-    return None
+    # Precompute role flags once so permission decorators don't re-probe them
+    if user is not None:
+        user._role_bits = compute_role_bits(user)
+    return user
 
 
 def _select_locale():
@@ -1,6 +1,22 @@
+import re
+
 from flask_wtf import FlaskForm
 from wtforms import PasswordField, StringField
-from wtforms.validators import DataRequired, Optional, Email, EqualTo, Length, Regexp, ValidationError
+from wtforms.validators import DataRequired, EqualTo, Length, ValidationError
+
+_PASSWORD_MIN_LENGTH = 8
+_PASSWORD_RE = re.compile(r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d).+$")
+
+
+def _validate_password(form, field):
+    """Length and character-class checks in one validator call."""
+    value = field.data or ""
+    if len(value) < _PASSWORD_MIN_LENGTH:
+        raise ValidationError("Password must be at least 8 characters.")
+    if not _PASSWORD_RE.match(value):
+        raise ValidationError(
+            "Password must contain at least one uppercase letter, one lowercase letter, and one number."
+        )
 
 
 class JoinForm(FlaskForm):
@@ -14,14 +30,7 @@ class JoinForm(FlaskForm):
     # )
     password = PasswordField(
         "Password",
-        validators=[
-            DataRequired(),
-            Length(min=8, message="Password must be at least 8 characters."),
-            Regexp(
-                r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d).+$",
-                message="Password must contain at least one uppercase letter, one lowercase letter, and one number.",
-            ),
-        ],
+        validators=[DataRequired(), _validate_password],
     )
     confirm_password = PasswordField(
         "Confirm password",
@@ -38,16 +47,26 @@ class JoinForm(FlaskForm):
 
     def validate_username(self, field):
         """Custom validation for username against invitation requirements."""
-        from app.models import Invitation
         from sqlalchemy import func
-        
-        # Get the invitation code from the form
+
+        from app.extensions import db
+        from app.models import Invitation
+        from app.services.invites import MAX_CODESIZE, MIN_CODESIZE
+
+        # Get the invitation code from the form. Nothing to compare against
+        # (DataRequired reports the empty username), and a code that fails its
+        # own length check can't match an invitation - skip the query.
         code = self.code.data
-        if code:
-            invitation = Invitation.query.filter(
-                func.lower(Invitation.code) == code.lower()
-            ).first()
-            
-            if invitation and invitation.required_username:
-                if field.data != invitation.required_username:
-                    raise ValidationError(f"Username must be exactly '{invitation.required_username}' for this invitation.")
+        if not field.data or not code or not (MIN_CODESIZE <= len(code) <= MAX_CODESIZE):
+            return
+
+        # Only the required username is needed; lower(code) is indexed
+        required_username = (
+            db.session.query(Invitation.required_username)
+            .filter(func.lower(Invitation.code) == code.lower())
+            .limit(1)
+            .scalar()
+        )
+
+        if required_username and field.data != required_username:
+            raise ValidationError(f"Username must be exactly '{required_username}' for this invitation.")
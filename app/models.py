@@ -132,6 +132,11 @@ class Invitation(db.Model):
     # Required username field for invitations
     required_username = db.Column(db.String, nullable=True)
 
+    # Codes are matched case-insensitively, so index the lowered value
+    __table_args__ = (
+        db.Index("ix_invitation_code_lower", db.func.lower(code)),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -277,38 +282,52 @@ class User(db.Model, UserMixin):
         else:
             self.accessible_libraries = json.dumps(libraries)
 
-    def update_standardized_metadata(self, details):
-        """Update user with standardized metadata from MediaUserDetails."""
+    def standardized_metadata(self, details) -> dict | None:
+        """Column values for the standardized metadata in a MediaUserDetails.
+
+        Returns ``None`` when *details* is not a ``MediaUserDetails``.
+        """
+        import json
+
         from app.services.media.user_details import MediaUserDetails
 
         if not isinstance(details, MediaUserDetails):
-            return
-
-        # Update standardized columns
-        self.is_admin = details.is_admin
-        self.allow_downloads = getattr(details, "allow_downloads", False)
-        self.allow_live_tv = getattr(details, "allow_live_tv", False)
-        self.allow_camera_upload = getattr(details, "allow_camera_upload", False)
+            return None
 
         # Extract library names
         if details.library_access is None:
             # Full access - get all server libraries
-            # Import Library here to avoid circular import
-            from app.models import Library  # type: ignore
-
             if self.server_id:
                 all_libs = Library.query.filter_by(
                     server_id=self.server_id, enabled=True
                 ).all()
-                self.set_accessible_libraries([lib.name for lib in all_libs])
+                library_names = [lib.name for lib in all_libs]
             else:
-                self.set_accessible_libraries([])
+                library_names = []
         else:
             # Specific library access
-            accessible_names = [
+            library_names = [
                 lib.library_name for lib in details.library_access if lib.has_access
             ]
-            self.set_accessible_libraries(accessible_names)
+
+        return {
+            "is_admin": details.is_admin,
+            "allow_downloads": getattr(details, "allow_downloads", False),
+            "allow_live_tv": getattr(details, "allow_live_tv", False),
+            "allow_camera_upload": getattr(details, "allow_camera_upload", False),
+            "accessible_libraries": (
+                json.dumps(library_names) if library_names else None
+            ),
+        }
+
+    def update_standardized_metadata(self, details):
+        """Update user with standardized metadata from MediaUserDetails."""
+        values = self.standardized_metadata(details)
+        if values is None:
+            return
+
+        for column, value in values.items():
+            setattr(self, column, value)
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -342,6 +361,10 @@ class AdminAccount(db.Model, UserMixin):
     jellyfin_server = db.Column(db.String, nullable=True)
     jellyfin_user_id = db.Column(db.String, nullable=True)
 
+    # Hashes starting with this prefix never match any password (accounts that
+    # authenticate elsewhere, e.g. Jellyfin-linked guests)
+    UNUSABLE_PASSWORD_PREFIX = "!"
+
     # ── helpers ────────────────────────────────────────────────────────────
     def set_password(self, raw_password: str):
         """Hash *raw_password* with *scrypt* and store it."""
@@ -351,6 +374,22 @@ class AdminAccount(db.Model, UserMixin):
 
         self.password_hash = generate_password_hash(raw_password, "scrypt")
 
+    @classmethod
+    def unusable_password_hash(cls) -> str:
+        """Return a random hash value that no password will ever match."""
+        import secrets
+
+        return cls.UNUSABLE_PASSWORD_PREFIX + secrets.token_urlsafe(22)
+
+    def set_unusable_password(self):
+        """Disable local password login without paying for a scrypt hash."""
+        self.password_hash = self.unusable_password_hash()
+
+    def has_usable_password(self) -> bool:
+        return bool(self.password_hash) and not self.password_hash.startswith(
+            self.UNUSABLE_PASSWORD_PREFIX
+        )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -360,6 +399,8 @@ class AdminAccount(db.Model, UserMixin):
             check_password_hash,  # local import to avoid circular
         )
 
+        if not raw_password or not self.has_usable_password():
+            return False
         return check_password_hash(self.password_hash, raw_password)
 
     def is_admin(self) -> bool:
@@ -494,6 +535,20 @@ class MediaServer(db.Model):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @property
+    def client(self):
+        """Media client for this server, built once per loaded row.
+
+        Rebuilt when the connection details on this instance change.
+        """
+        from app.services.media.service import get_client_for_media_server
+
+        key = (self.server_type, self.url, self.api_key)
+        cached = self.__dict__.get("_client")
+        if cached is None or cached[0] != key:
+            cached = self._client = (key, get_client_for_media_server(self))
+        return cached[1]
+
 
 class Library(db.Model):
     __tablename__ = "library"
@@ -262,16 +262,27 @@ def cleanup_expired_user_by_email(email: str) -> None:
     Args:
         email: The email address to clean up from expired users
     """
-    if not email:
+    cleanup_expired_users_by_email([email])
+
+
+def cleanup_expired_users_by_email(emails) -> None:
+    """
+    Remove expired user entries for several re-added email addresses at once.
+
+    Args:
+        emails: Email addresses to clean up from expired users
+    """
+    emails = {email for email in emails if email}
+    if not emails:
         return
 
-    expired_users = ExpiredUser.query.filter_by(email=email).all()
+    expired_users = ExpiredUser.query.filter(ExpiredUser.email.in_(emails)).all()
     for expired_user in expired_users:
         db.session.delete(expired_user)
         logging.info(
             "🔄 Removed expired user record for %s (email: %s) - user re-added",
             expired_user.username,
-            email,
+            expired_user.email,
         )
 
     if expired_users:
@@ -6,7 +6,6 @@ import logging
 from abc import ABC, abstractmethod
 
 from app.models import MediaServer
-from app.services.media.service import get_client_for_media_server
 
 
 class ServerAccountManager(ABC):
@@ -25,7 +24,7 @@ class ServerAccountManager(ABC):
 
     def get_client(self):
         """Get media client for this server."""
-        return get_client_for_media_server(self.server)
+        return self.server.client
 
 
 class PlexAccountManager(ServerAccountManager):
@@ -1,10 +1,161 @@
 """Jellyfin authentication service for validating user credentials."""
 
+import hashlib
+import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
 import requests
-from typing import Optional, Tuple
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select
+from urllib3.util.retry import Retry
 
 from app.models import MediaServer
+from app.utils.cache_invalidation import invalidate_on_commit
+
+if TYPE_CHECKING:
+    from app.models import AdminAccount
+
+# Upper bound on concurrent authentication requests per login attempt
+_MAX_AUTH_WORKERS = 8
+
+# Shared across logins so threads are started once per process, not per
+# attempt. Workers are spawned lazily, so this is safe to import pre-fork.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_AUTH_WORKERS, thread_name_prefix="jellyfin-auth"
+)
+
+# (connect, read) timeouts: dead hosts fail fast, slow-but-alive ones get time
+_AUTH_TIMEOUT = (2, 8)
+
+_AUTH_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "X-Emby-Authorization": 'MediaBrowser Client="Wizarr", Device="Wizarr", DeviceId="wizarr-auth", Version="1.0.0"'
+}
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session so repeated logins reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # One quick reconnect attempt, but never replay a request that reached
+        # the server - a slow read means the server is alive, just busy.
+        max_retries=Retry(
+            total=1,
+            connect=1,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+# Recently checked credentials, keyed by (server_url, username, sha256(password)).
+# Only a digest of the password is kept. Both windows are deliberately short:
+# a password changed or revoked on Jellyfin keeps working here until its
+# cached success expires, so this only absorbs bursts of repeated logins.
+_AUTH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_AUTH_FAILURE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_AUTH_CACHE_LOCK = threading.Lock()
+
+
+def _auth_cache_key(server_url: str, username: str, password: str) -> tuple[str, str, bytes]:
+    return server_url, username, hashlib.sha256(password.encode()).digest()
+
+
+def clear_auth_cache(username: str | None = None) -> None:
+    """Forget cached authentication results, optionally only for *username*."""
+    with _AUTH_CACHE_LOCK:
+        for cache in (_AUTH_CACHE, _AUTH_FAILURE_CACHE):
+            if username is None:
+                cache.clear()
+                continue
+            for key in [k for k in cache if k[1] == username]:
+                cache.pop(key, None)
+
+
+# Circuit breaker per server URL: after _BREAKER_THRESHOLD consecutive network
+# failures the server is skipped for _BREAKER_COOLDOWN seconds, after which a
+# single attempt is let through again (half-open).
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30
+_breakers: dict[str, dict] = {}
+_BREAKER_LOCK = threading.Lock()
+
+
+def _breaker_is_open(server_url: str) -> bool:
+    with _BREAKER_LOCK:
+        state = _breakers.get(server_url)
+        if not state or state["failures"] < _BREAKER_THRESHOLD:
+            return False
+        if time.monotonic() - state["opened_at"] >= _BREAKER_COOLDOWN:
+            # Half-open: let this attempt probe the server, hold the rest back
+            state["opened_at"] = time.monotonic()
+            return False
+        return True
+
+
+def _record_server_failure(server_url: str) -> None:
+    with _BREAKER_LOCK:
+        state = _breakers.setdefault(server_url, {"failures": 0, "opened_at": 0.0})
+        state["failures"] += 1
+        if state["failures"] >= _BREAKER_THRESHOLD:
+            if state["failures"] == _BREAKER_THRESHOLD:
+                logging.warning(
+                    f"Jellyfin server {server_url} unreachable {state['failures']} times in a row; "
+                    f"skipping it for {_BREAKER_COOLDOWN}s"
+                )
+            state["opened_at"] = time.monotonic()
+
+
+def _record_server_success(server_url: str) -> None:
+    with _BREAKER_LOCK:
+        _breakers.pop(server_url, None)
+
+
+# (name, url) of every configured Jellyfin server. The set changes rarely, so
+# it's kept for a minute and dropped once a MediaServer write is committed.
+_SERVER_CACHE: TTLCache = TTLCache(maxsize=1, ttl=60)
+_SERVER_CACHE_LOCK = threading.Lock()
+
+
+def _get_jellyfin_servers() -> list[tuple[str, str]]:
+    with _SERVER_CACHE_LOCK:
+        if (servers := _SERVER_CACHE.get("jellyfin")) is not None:
+            return servers
+
+    from app.extensions import db
+
+    # Plain read; nothing here commits, so a cache miss costs this one SELECT
+    rows = db.session.execute(
+        select(MediaServer.name, MediaServer.url).where(
+            MediaServer.server_type == "jellyfin"
+        ).order_by(MediaServer.id)
+    )
+    servers = [(name, url) for name, url in rows]
+    with _SERVER_CACHE_LOCK:
+        _SERVER_CACHE["jellyfin"] = servers
+    return servers
+
+
+@invalidate_on_commit(MediaServer)
+def invalidate_jellyfin_server_cache() -> None:
+    """Drop the cached Jellyfin server list."""
+    with _SERVER_CACHE_LOCK:
+        _SERVER_CACHE.clear()
 
 
 def authenticate_jellyfin_user(username: str, password: str) -> Tuple[bool, Optional[str], Optional[dict]]:
@@ -22,26 +173,41 @@ def authenticate_jellyfin_user(username: str, password: str) -> Tuple[bool, Opti
         - user_info: User information from Jellyfin (if successful)
     """
     # Get all Jellyfin servers
-    jellyfin_servers = MediaServer.query.filter_by(server_type="jellyfin").all()
+    jellyfin_servers = _get_jellyfin_servers()
     
     if not jellyfin_servers:
         logging.warning("No Jellyfin servers configured for authentication")
         return False, None, None
     
-    for server in jellyfin_servers:
-        try:
-            success, user_info = _authenticate_against_server(
-                server.url, username, password
-            )
+    # Fan out to every server at once so one slow/offline server doesn't
+    # serialise the others, but read the answers back in DB order so a user
+    # known to several servers always resolves to the same one.
+    futures = [
+        (name, _EXECUTOR.submit(_authenticate_against_server, url, username, password))
+        for name, url in jellyfin_servers
+    ]
+    try:
+        for server_name, future in futures:
+            try:
+                success, user_info = future.result()
+            except Exception as e:
+                logging.warning(f"Failed to authenticate against {server_name}: {e}")
+                continue
             if success:
-                return True, server.name, user_info
-        except Exception as e:
-            logging.warning(f"Failed to authenticate against {server.name}: {e}")
-            continue
-    
+                return True, server_name, user_info
+    finally:
+        # Don't wait for stragglers once we have an answer
+        for _name, future in futures:
+            future.cancel()
+
     return False, None, None
 
 
+@lru_cache(maxsize=64)
+def _auth_url(server_url: str) -> str:
+    return f"{server_url}Users/AuthenticateByName"
+
+
 def _authenticate_against_server(server_url: str, username: str, password: str) -> Tuple[bool, Optional[dict]]:
     """
     Authenticate against a specific Jellyfin server.
@@ -58,59 +224,86 @@ def _authenticate_against_server(server_url: str, username: str, password: str)
     if not server_url.endswith('/'):
         server_url += '/'
     
-    auth_url = f"{server_url}Users/AuthenticateByName"
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "X-Emby-Authorization": 'MediaBrowser Client="Wizarr", Device="Wizarr", DeviceId="wizarr-auth", Version="1.0.0"'
-    }
+    auth_url = _auth_url(server_url)
+
+    cache_key = _auth_cache_key(server_url, username, password)
+    with _AUTH_CACHE_LOCK:
+        if (cached := _AUTH_CACHE.get(cache_key)) is not None:
+            return True, cached
+        if cache_key in _AUTH_FAILURE_CACHE:
+            return False, None
+
+    if _breaker_is_open(server_url):
+        logging.debug(f"Skipping Jellyfin server {server_url}: circuit breaker open")
+        return False, None
     
-    payload = {
-        "Username": username,
-        "Pw": password
-    }
+    # _AUTH_HEADERS already carries the JSON content type, so send raw bytes
+    body = json.dumps({"Username": username, "Pw": password}).encode()
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             auth_url, 
-            json=payload, 
-            headers=headers, 
-            timeout=10,
+            data=body, 
+            headers=_AUTH_HEADERS, 
+            timeout=_AUTH_TIMEOUT,
             verify=True
         )
+        _record_server_success(server_url)
         
         if response.status_code == 200:
             user_data = response.json()
+            user = user_data.get("User") or {}
             # Extract relevant user information
             user_info = {
-                "id": user_data.get("User", {}).get("Id"),
-                "name": user_data.get("User", {}).get("Name"),
-                "has_password": user_data.get("User", {}).get("HasPassword", True),
-                "has_configured_password": user_data.get("User", {}).get("HasConfiguredPassword", True),
+                "id": user.get("Id"),
+                "name": user.get("Name"),
+                "has_password": user.get("HasPassword", True),
+                "has_configured_password": user.get("HasConfiguredPassword", True),
                 "server_id": user_data.get("ServerId"),
                 "access_token": user_data.get("AccessToken"),
-                "policy": user_data.get("User", {}).get("Policy", {})
+                "policy": user.get("Policy") or {}
             }
+            with _AUTH_CACHE_LOCK:
+                _AUTH_CACHE[cache_key] = user_info
             logging.info(f"Successfully authenticated user '{username}' against Jellyfin server")
             return True, user_info
         elif response.status_code == 401:
             # Invalid credentials
+            with _AUTH_CACHE_LOCK:
+                _AUTH_FAILURE_CACHE[cache_key] = True
             logging.debug(f"Invalid credentials for user '{username}' on Jellyfin server")
             return False, None
         else:
             logging.warning(f"Jellyfin authentication failed with status {response.status_code}: {response.text}")
             return False, None
             
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Network error during Jellyfin authentication: {e}")
+    except requests.exceptions.ConnectTimeout as e:
+        # Unreachable server - expected when one of several servers is offline
+        _record_server_failure(server_url)
+        logging.debug(f"Timed out connecting to Jellyfin server {server_url}: {e}")
         raise
-    except Exception as e:
-        logging.error(f"Unexpected error during Jellyfin authentication: {e}")
+    except requests.exceptions.RequestException as e:
+        _record_server_failure(server_url)
+        logging.exception(f"Network error during Jellyfin authentication: {e}")
         raise
 
 
-def create_guest_account_from_jellyfin(username: str, jellyfin_server_name: str, user_info: dict) -> 'AdminAccount':
+def _build_guest_account(username: str, jellyfin_server_name: str, user_info: dict) -> "AdminAccount":
+    from app.models import AdminAccount
+
+    account = AdminAccount(
+        username=username,
+        role="guest",
+        jellyfin_server=jellyfin_server_name,
+        jellyfin_user_id=user_info.get("id")
+    )
+    # We don't store the actual password since we'll authenticate against
+    # Jellyfin; an unusable hash blocks local auth without hashing cost
+    account.set_unusable_password()
+    return account
+
+
+def create_guest_account_from_jellyfin(username: str, jellyfin_server_name: str, user_info: dict) -> "AdminAccount":
     """
     Create a new guest account based on Jellyfin user information.
     
@@ -122,24 +315,100 @@ def create_guest_account_from_jellyfin(username: str, jellyfin_server_name: str,
     Returns:
         The created AdminAccount instance
     """
-    from app.models import AdminAccount
     from app.extensions import db
+
+    account = _build_guest_account(username, jellyfin_server_name, user_info)
+    db.session.add(account)
+    db.session.commit()
+
+    # The account now exists with a fresh role; drop anything cached for it
+    clear_auth_cache(username)
     
-    # Create a new guest account
-    account = AdminAccount(
+    logging.info(f"Created guest account for Jellyfin user '{username}' from server '{jellyfin_server_name}'")
+    return account
+
+
+def create_guest_accounts_from_jellyfin(entries: list[tuple[str, str, dict]]) -> list["AdminAccount"]:
+    """
+    Create several guest accounts in a single transaction.
+
+    Args:
+        entries: ``(username, jellyfin_server_name, user_info)`` tuples, as
+            accepted by :func:`create_guest_account_from_jellyfin`
+
+    Returns:
+        The created AdminAccount instances, in input order
+    """
+    from app.extensions import db
+
+    accounts = [_build_guest_account(*entry) for entry in entries]
+    db.session.add_all(accounts)
+    db.session.commit()
+
+    for username, _server_name, _user_info in entries:
+        clear_auth_cache(username)
+
+    logging.info(f"Created {len(accounts)} guest accounts for Jellyfin users")
+    return accounts
+
+
+def login_or_create_guest(username: str, password: str) -> "AdminAccount | None":
+    """
+    Authenticate against Jellyfin and return the matching guest account.
+
+    The account is created if it doesn't exist yet. An existing account is
+    only returned when it is linked to the server that accepted the
+    credentials; local accounts with the same username are never taken over.
+
+    Args:
+        username: The username to authenticate
+        password: The password to authenticate
+
+    Returns:
+        The AdminAccount to log in, or None if authentication failed
+    """
+    from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    from app.extensions import db
+    from app.models import AdminAccount
+
+    success, server_name, user_info = authenticate_jellyfin_user(username, password)
+    if not success:
+        return None
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        account = AdminAccount.query.filter_by(username=username).first()
+        if account is None:
+            return create_guest_account_from_jellyfin(username, server_name, user_info)
+        return account if account.jellyfin_server == server_name else None
+
+    # Single upsert instead of SELECT-then-INSERT: creates the guest, or
+    # refreshes the Jellyfin user id of an account already linked to this server
+    insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(AdminAccount).values(
         username=username,
         role="guest",
-        jellyfin_server=jellyfin_server_name,
-        jellyfin_user_id=user_info.get("id")
+        jellyfin_server=server_name,
+        jellyfin_user_id=user_info.get("id"),
+        password_hash=AdminAccount.unusable_password_hash(),
     )
-    
-    # We don't store the actual password since we'll authenticate against Jellyfin
-    # Set a random password that won't be used for local auth
-    import secrets
-    account.set_password(secrets.token_urlsafe(32))
-    
-    db.session.add(account)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AdminAccount.username],
+        set_={"jellyfin_user_id": stmt.excluded.jellyfin_user_id},
+        where=AdminAccount.jellyfin_server == server_name,
+    ).returning(AdminAccount)
+    account = db.session.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).first()
     db.session.commit()
-    
-    logging.info(f"Created guest account for Jellyfin user '{username}' from server '{jellyfin_server_name}'")
-    return account
\ No newline at end of file
+
+    if account is None:
+        logging.warning(
+            f"Jellyfin user '{username}' matches a local account not linked to '{server_name}'"
+        )
+        return None
+
+    clear_auth_cache(username)
+    return account
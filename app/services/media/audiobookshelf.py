@@ -13,7 +13,7 @@ from app.extensions import db
 from app.models import Invitation, Library, User
 from app.services.invites import is_invite_valid
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 from .utils import (
     DateHelper,
     LibraryAccessHelper,
@@ -25,8 +25,7 @@ if TYPE_CHECKING:
     from app.services.media.user_details import MediaUserDetails
 
 
-@register_media_client("audiobookshelf")
-class AudiobookshelfClient(RestApiMixin):
+class AudiobookshelfClient(RestApiMixin, server_type="audiobookshelf"):
     """Very small wrapper around the Audiobookshelf REST API."""
 
     #: API prefix that all modern ABS endpoints share
@@ -309,7 +308,7 @@ class AudiobookshelfClient(RestApiMixin):
         try:
             response = self.get(f"{self.API_PREFIX}/users")
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
             # Handle both direct array and wrapped response formats
             raw_users = data if isinstance(data, list) else data.get("users", [])
@@ -10,18 +10,29 @@
 
 from __future__ import annotations
 
+import copy
+import json
 import logging
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import quote_plus
 
 import requests
+from cachetools import TTLCache
+from flask import current_app
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select, tuple_, update
+from urllib3.util.retry import Retry
 
 from app.extensions import db
-from app.models import MediaServer, Settings, User
+from app.models import Invitation, MediaServer, Settings, User
+from app.services.image_proxy import ImageProxyService
+from app.services.media.user_details import MediaUserDetails
 from app.services.notifications import notify
-
-if TYPE_CHECKING:
-    from app.services.media.user_details import MediaUserDetails
+from app.utils.cache_invalidation import invalidate_on_commit
 
 # ---------------------------------------------------------------------------
 # Registry helpers
@@ -34,25 +45,238 @@ CLIENTS: dict[str, type[MediaClient]] = {}
 def register_media_client(name: str):
     """Decorator to register a MediaClient under a given *server_type* name.
 
-    We additionally annotate the class with the attribute ``_server_type`` so
-    instances can later resolve the corresponding ``MediaServer`` row without
-    external knowledge.
+    Kept for backwards compatibility – clients normally register themselves by
+    passing ``server_type="..."`` in their class statement (see
+    ``MediaClient.__init_subclass__``).
     """
 
     def decorator(cls):
-        cls._server_type = name  # type: ignore[attr-defined]
-        CLIENTS[name] = cls
+        _register(cls, name)
         return cls
 
     return decorator
 
 
+def _register(cls, name: str) -> None:
+    # ``_server_type`` lets instances resolve their MediaServer row without
+    # external knowledge
+    cls._server_type = name  # type: ignore[attr-defined]
+    CLIENTS[name] = cls
+
+
+# Characters quote_plus() leaves untouched; image proxy tokens (hex digests)
+# always match, so generate_image_proxy_url can skip quoting them
+_TOKEN_SAFE_RE = re.compile(r"\A[A-Za-z0-9_.~-]+\Z")
+
+# Upper bound on concurrent get_user_details() calls in _cache_user_metadata_batch
+_METADATA_FETCH_WORKERS = 8
+
+
+# (connect, read) timeout for RestApiMixin requests
+_HTTP_TIMEOUT = (3, 10)
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    # Clients authenticate with headers; a shared jar would replay one
+    # server's Set-Cookie on later calls, even after its credentials change
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every RestApiMixin client so TCP/TLS connections to a media server
+# are reused across requests instead of being set up for every call.  Cookies
+# are never stored, so nothing leaks between clients, servers or threads.
+_HTTP_SESSION = _build_http_session()
+
+
+# Delivers join notifications off the request path (see MediaClient.join)
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notify")
+
+
+def _safe_notify(app, title: str, message: str, **kwargs) -> None:
+    try:
+        with app.app_context():
+            notify(title, message, **kwargs)
+    except Exception as e:
+        logging.warning(f"Failed to send join notification: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Credential cache
+# ---------------------------------------------------------------------------
+
+# server_type -> (id, url, api_key) of the first matching MediaServer, plus
+# ("settings", url_key, token_key) -> (url, token) for the legacy fallback.
+# Plain tuples rather than ORM rows so entries never outlive their session.
+_SERVER_ROW_CACHE: TTLCache = TTLCache(maxsize=64, ttl=60)
+_SERVER_ROW_CACHE_LOCK = threading.Lock()
+
+
+def _get_server_credentials(server_type: str) -> tuple[int, str, str] | None:
+    with _SERVER_ROW_CACHE_LOCK:
+        if server_type in _SERVER_ROW_CACHE:
+            return _SERVER_ROW_CACHE[server_type]
+
+    row = (
+        db.session.query(MediaServer.id, MediaServer.url, MediaServer.api_key)
+        .filter_by(server_type=server_type)
+        .first()
+    )
+    credentials = tuple(row) if row is not None else None
+    with _SERVER_ROW_CACHE_LOCK:
+        _SERVER_ROW_CACHE[server_type] = credentials
+    return credentials
+
+
+def _get_legacy_credentials(url_key: str, token_key: str) -> tuple[str, str]:
+    """Read the legacy Settings pair in one projected query, cached like rows."""
+    cache_key = ("settings", url_key, token_key)
+    with _SERVER_ROW_CACHE_LOCK:
+        if cache_key in _SERVER_ROW_CACHE:
+            return _SERVER_ROW_CACHE[cache_key]
+
+    legacy = dict(
+        db.session.execute(
+            select(Settings.key, Settings.value).where(
+                Settings.key.in_((url_key, token_key))
+            )
+        ).all()
+    )
+    credentials = (legacy.get(url_key), legacy.get(token_key))
+    with _SERVER_ROW_CACHE_LOCK:
+        _SERVER_ROW_CACHE[cache_key] = credentials
+    return credentials
+
+
+@invalidate_on_commit(MediaServer, Settings)
+def invalidate_server_credentials_cache() -> None:
+    """Drop cached MediaServer (and legacy Settings) credentials."""
+    with _SERVER_ROW_CACHE_LOCK:
+        _SERVER_ROW_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Health-card cache
+# ---------------------------------------------------------------------------
+
+# (server_id, method name) -> result of a lightweight health-check call.  Health
+# cards poll these for every server, so a short TTL collapses bursts of polls
+# into one upstream request per server.
+_SERVER_INFO_CACHE: TTLCache = TTLCache(maxsize=256, ttl=15)
+_SERVER_INFO_CACHE_LOCK = threading.Lock()
+
+
+def _is_error_result(result) -> bool:
+    """True for the ``{"error": ...}`` payloads clients return on failure."""
+    if not isinstance(result, dict):
+        return False
+    return "error" in result or any(
+        isinstance(value, dict) and "error" in value for value in result.values()
+    )
+
+
+def cached_per_server(method):
+    """Memoise a no-argument client method per ``server_id`` for a few seconds.
+
+    Clients without a ``server_id`` (legacy Settings or ad-hoc URL/token
+    clients) always call through, and error results are never stored so an
+    outage clears as soon as the server answers again.  Callers get a deep
+    copy so mutating the result never leaks into the cache.
+    """
+
+    @wraps(method)
+    def wrapper(self):
+        server_id = getattr(self, "server_id", None)
+        if server_id is None:
+            return method(self)
+
+        key = (server_id, method.__name__)
+        with _SERVER_INFO_CACHE_LOCK:
+            if key in _SERVER_INFO_CACHE:
+                return copy.deepcopy(_SERVER_INFO_CACHE[key])
+
+        result = method(self)
+        if not _is_error_result(result):
+            with _SERVER_INFO_CACHE_LOCK:
+                _SERVER_INFO_CACHE[key] = copy.deepcopy(result)
+        return result
+
+    wrapper._server_cached = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _recorded_statistics(client) -> dict | None:
+    """Copy of the last successful ``statistics()`` result for *client*'s server."""
+    server_id = getattr(client, "server_id", None)
+    if server_id is None:
+        return None
+    with _SERVER_INFO_CACHE_LOCK:
+        stats = _SERVER_INFO_CACHE.get((server_id, "statistics"))
+    return copy.deepcopy(stats) if stats is not None else None
+
+
+def record_statistics(method):
+    """Remember each successful ``statistics()`` result for a few seconds.
+
+    ``statistics()`` itself always runs, since it may sync users; the recorded
+    copy only lets the readonly health path skip its own upstream calls.
+    """
+
+    @wraps(method)
+    def wrapper(self):
+        result = method(self)
+        server_id = getattr(self, "server_id", None)
+        if server_id is not None and not _is_error_result(result):
+            with _SERVER_INFO_CACHE_LOCK:
+                _SERVER_INFO_CACHE[(server_id, "statistics")] = copy.deepcopy(result)
+        return result
+
+    wrapper._server_cached = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def prefer_cached_statistics(method):
+    """Serve ``get_readonly_statistics`` from a recorded ``statistics()`` result.
+
+    The full statistics dict is a superset of the readonly one, so when
+    ``statistics()`` ran for this server within the cache window its result is
+    reused instead of issuing the lightweight user-count and server-info calls.
+    """
+
+    @wraps(method)
+    def wrapper(self):
+        stats = _recorded_statistics(self)
+        return stats if stats is not None else method(self)
+
+    wrapper._server_cached = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+@invalidate_on_commit(MediaServer)
+def invalidate_server_info_cache(server_id: int | None = None) -> None:
+    """Forget cached health-check results for *server_id* (or every server)."""
+    with _SERVER_INFO_CACHE_LOCK:
+        if server_id is None:
+            _SERVER_INFO_CACHE.clear()
+            return
+        for key in [k for k in _SERVER_INFO_CACHE if k[0] == server_id]:
+            del _SERVER_INFO_CACHE[key]
+
+
 # ---------------------------------------------------------------------------
 # Base class
 # ---------------------------------------------------------------------------
 
 
-class MediaClient(ABC):
+class MediaClient:
     """Common helper wrapper around third-party media-server SDKs.
 
     On initialisation we attempt the following resolution order for
@@ -67,6 +291,62 @@ class MediaClient(ABC):
     url: str | None
     token: str | None
 
+    # Hooks every concrete client must implement.  Checked once when the
+    # subclass is defined rather than on every instantiation (as ABC does).
+    _REQUIRED_METHODS = (
+        "libraries",
+        "create_user",
+        "update_user",
+        "disable_user",
+        "delete_user",
+        "get_user",
+        "list_users",
+        "now_playing",
+        "statistics",
+        "_do_join",
+        "scan_libraries",
+    )
+
+    # Health-card hooks and the per-server caching applied to them.  Overrides
+    # are wrapped in __init_subclass__, so clients never opt in by hand.
+    _HEALTH_HOOKS = {
+        "get_user_count": cached_per_server,
+        "get_server_info": cached_per_server,
+        "statistics": record_statistics,
+        "get_readonly_statistics": prefer_cached_statistics,
+    }
+
+    def __init_subclass__(
+        cls, server_type: str | None = None, abstract: bool = False, **kwargs
+    ) -> None:
+        """Register the subclass and check it implements every required hook.
+
+        Concrete clients name their type in the class statement, e.g.
+        ``class JellyfinClient(RestApiMixin, server_type="jellyfin")``, which
+        adds them to ``CLIENTS``.  Intermediate base classes pass
+        ``abstract=True`` to skip the check.  Overrides of the
+        ``_HEALTH_HOOKS`` methods get their caching wrapper here.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, wrap in cls._HEALTH_HOOKS.items():
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_server_cached", False):
+                setattr(cls, name, wrap(method))
+        if server_type is not None:
+            _register(cls, server_type)
+        if abstract:
+            return
+        missing = [
+            name
+            for name in cls._REQUIRED_METHODS
+            if getattr(cls, name) is getattr(MediaClient, name)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} must implement {', '.join(missing)} "
+                "(or be declared with abstract=True)"
+            )
+
     # NOTE: keep *url_key* & *token_key* keyword arguments so older subclass
     # calls (e.g. super().__init__(url_key="server_url")) continue to work.
 
@@ -89,11 +369,9 @@ class MediaClient(ABC):
         # ------------------------------------------------------------------
         server_type = getattr(self.__class__, "_server_type", None)
         if server_type:
-            row = (
-                db.session.query(MediaServer).filter_by(server_type=server_type).first()
-            )
-            if row is not None:
-                self._attach_server_row(row)
+            credentials = _get_server_credentials(server_type)
+            if credentials is not None:
+                self.server_id, self.url, self.token = credentials
                 return
 
         # ------------------------------------------------------------------
@@ -103,16 +381,48 @@ class MediaClient(ABC):
         # callers relying on those attributes should migrate to supply a
         # MediaServer.
 
-        self.url = db.session.query(Settings.value).filter_by(key=url_key).scalar()
-        self.token = db.session.query(Settings.value).filter_by(key=token_key).scalar()
+        self.url, self.token = _get_legacy_credentials(url_key, token_key)
+
+    @classmethod
+    def load_all(cls) -> list[MediaClient]:
+        """Instantiate a client for every configured MediaServer in one query.
+
+        Called on ``MediaClient`` this covers every registered server type;
+        called on a concrete client it only returns servers of that type.
+        Servers whose type has no registered client are skipped with a
+        warning.
+        """
+        query = db.session.query(MediaServer)
+        server_type = getattr(cls, "_server_type", None)
+        if server_type:
+            query = query.filter_by(server_type=server_type)
+
+        clients = []
+        for row in query.all():
+            if row.server_type not in CLIENTS:
+                logging.warning(
+                    f"Skipping server {row.name} ({row.server_type}): "
+                    "unsupported media server type"
+                )
+                continue
+            clients.append(CLIENTS[row.server_type](media_server=row))
+        return clients
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    @property
+    def server_row(self) -> MediaServer | None:
+        """The backing MediaServer row, loaded on first access when needed."""
+        row = getattr(self, "_server_row", None)
+        if row is None and getattr(self, "server_id", None) is not None:
+            row = self._server_row = db.session.get(MediaServer, self.server_id)
+        return row
+
     def _attach_server_row(self, row: MediaServer) -> None:
         """Populate instance attributes from a MediaServer row."""
-        self.server_row: MediaServer = row
+        self._server_row: MediaServer | None = row
         self.server_id: int = row.id  # type: ignore[attr-defined]
         self.url = row.url  # type: ignore[attr-defined]
         self.token = row.api_key  # type: ignore[attr-defined]
@@ -127,17 +437,17 @@ class MediaClient(ABC):
         Returns:
             Secure proxy URL with opaque token: /image-proxy?token=xxx
         """
-        from urllib.parse import quote_plus
-
-        from app.services.image_proxy import ImageProxyService
-
         # Generate opaque token for this URL
         token = ImageProxyService.generate_token(image_url, server_id=self.server_id)
 
         # Return proxy URL with token
-        return f"/image-proxy?token={quote_plus(token)}"
+        if not _TOKEN_SAFE_RE.match(token):
+            token = quote_plus(token)
+        return f"/image-proxy?token={token}"
 
-    def _create_user_with_identity_linking(self, user_kwargs: dict) -> User:
+    def _create_user_with_identity_linking(
+        self, user_kwargs: dict, invitation: Invitation | None = None
+    ) -> User:
         """Create a User record with intelligent identity linking based on invitation type.
 
         This helper implements the correct identity linking logic:
@@ -151,59 +461,106 @@ class MediaClient(ABC):
 
         Args:
             user_kwargs: Dictionary of User model attributes
+            invitation: The invitation for ``user_kwargs["code"]`` if the caller
+                already loaded it, saving a lookup
 
         Returns:
             User: The created User record with identity_id set if applicable
         """
-        code = user_kwargs.get("code")
-        email = user_kwargs.get("email")
-
-        # Check if this is part of a multi-server invitation
-        if code:
-            from app.models import Invitation
-            from app.services.media.service import EMAIL_RE
-
-            invitation = Invitation.query.filter_by(code=code).first()
-
-            if invitation:
-                if not invitation.unlimited:
-                    # LIMITED invites: Always link users with same code (same person across servers)
-                    existing_user = User.query.filter_by(code=code).first()
-                    if existing_user and existing_user.identity_id:
-                        user_kwargs["identity_id"] = existing_user.identity_id
-                else:
-                    # UNLIMITED invites: Only link if same email (same person across servers)
-                    # Different emails = different people, should remain separate
-                    if email and EMAIL_RE.fullmatch(email):
-                        existing_user = User.query.filter_by(
-                            code=code, email=email
-                        ).first()
-                        if existing_user and existing_user.identity_id:
-                            user_kwargs["identity_id"] = existing_user.identity_id
-
-        # Clean up any expired user records for this email address
-        if email:
-            from app.services.expiry import cleanup_expired_user_by_email
-
-            cleanup_expired_user_by_email(email)
-
-        new_user = User(**user_kwargs)
-        db.session.add(new_user)
-        return new_user
-
-    @abstractmethod
+        return self._create_users_with_identity_linking(
+            [user_kwargs], [invitation] if invitation is not None else None
+        )[0]
+
+    def _create_users_with_identity_linking(
+        self, users_kwargs: list[dict], invitations: list[Invitation] | None = None
+    ) -> list[User]:
+        """Batch form of :meth:`_create_user_with_identity_linking`.
+
+        Invitations and candidate users for every code in *users_kwargs* are
+        fetched up front (one ``IN`` query each) and linked in memory, so
+        creating N users costs a constant number of lookups instead of 3N.
+
+        Args:
+            users_kwargs: One dictionary of User model attributes per user
+            invitations: Invitations the caller already loaded; only codes
+                not covered here are looked up
+
+        Returns:
+            list[User]: The created User records, in the same order
+        """
+        # Both modules import this one, so these stay function-local
+        from app.services.expiry import cleanup_expired_users_by_email
+        from app.services.media.service import EMAIL_RE
+
+        codes = {kwargs["code"] for kwargs in users_kwargs if kwargs.get("code")}
+        invitation_by_code = {
+            inv.code: inv for inv in invitations or () if inv.code in codes
+        }
+        if missing := codes - invitation_by_code.keys():
+            invitation_by_code.update(
+                (inv.code, inv)
+                for inv in Invitation.query.filter(Invitation.code.in_(missing))
+            )
+
+        # LIMITED invites: link on code alone, using the first user with that code
+        limited_codes = {
+            code for code, inv in invitation_by_code.items() if not inv.unlimited
+        }
+        by_code: dict[str, User] = {}
+        if limited_codes:
+            for user in User.query.filter(User.code.in_(limited_codes)).order_by(
+                User.id
+            ):
+                by_code.setdefault(user.code, user)
+
+        # UNLIMITED invites: only link if same email (same person across servers)
+        # Different emails = different people, should remain separate
+        # Validate each distinct address once - batches repeat emails across servers
+        fullmatch = EMAIL_RE.fullmatch
+        valid_emails = {
+            email
+            for email in {kwargs.get("email") for kwargs in users_kwargs}
+            if email and fullmatch(email)
+        }
+        pairs = {
+            (kwargs["code"], kwargs["email"])
+            for kwargs in users_kwargs
+            if kwargs.get("code") in invitation_by_code
+            and invitation_by_code[kwargs["code"]].unlimited
+            and kwargs.get("email") in valid_emails
+        }
+        by_code_email: dict[tuple[str, str], User] = {}
+        if pairs:
+            for user in User.query.filter(
+                tuple_(User.code, User.email).in_(pairs)
+            ).order_by(User.id):
+                by_code_email.setdefault((user.code, user.email), user)
+
+        for kwargs in users_kwargs:
+            code = kwargs.get("code")
+            if code in limited_codes:
+                existing_user = by_code.get(code)
+            else:
+                existing_user = by_code_email.get((code, kwargs.get("email")))
+            if existing_user and existing_user.identity_id:
+                kwargs["identity_id"] = existing_user.identity_id
+
+        # Clean up any expired user records for these email addresses
+        cleanup_expired_users_by_email(kwargs.get("email") for kwargs in users_kwargs)
+
+        new_users = [User(**kwargs) for kwargs in users_kwargs]
+        db.session.add_all(new_users)
+        return new_users
+
     def libraries(self):
         raise NotImplementedError
 
-    @abstractmethod
     def create_user(self, *args, **kwargs):
         raise NotImplementedError
 
-    @abstractmethod
     def update_user(self, *args, **kwargs):
         raise NotImplementedError
 
-    @abstractmethod
     def disable_user(self, user_id: str) -> bool:
         """Disable a user account on the media server.
 
@@ -215,11 +572,9 @@ class MediaClient(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def delete_user(self, *args, **kwargs):
         raise NotImplementedError
 
-    @abstractmethod
     def get_user(self, *args, **kwargs):
         raise NotImplementedError
 
@@ -236,8 +591,6 @@ class MediaClient(ABC):
             Default implementation delegates to get_user() for backward compatibility.
             Media clients should override this method to return MediaUserDetails directly.
         """
-        from app.services.media.user_details import MediaUserDetails
-
         # Fallback: use existing get_user and attempt basic conversion
         raw_details = self.get_user(user_identifier)
 
@@ -252,7 +605,9 @@ class MediaClient(ABC):
         """Cache metadata for a batch of users to improve performance.
 
         This method fetches detailed metadata for each user and caches it in the database
-        to avoid repeated API calls when viewing user details.
+        to avoid repeated API calls when viewing user details. The per-user
+        lookups are network-bound, so they run concurrently on a small thread
+        pool; the results are applied and committed once on the calling thread.
 
         Args:
             users: List of User objects to cache metadata for
@@ -260,38 +615,58 @@ class MediaClient(ABC):
         if not users:
             return
 
-        cached_count = 0
-        for user in users:
-            try:
-                # Determine the appropriate user identifier for this server type
-                user_identifier = self._get_user_identifier_for_details(user)
-                if not user_identifier:
-                    continue
-
-                # Get detailed metadata from the server
-                details = self.get_user_details(user_identifier)
+        app = current_app._get_current_object()
 
-                # Update the standardized metadata columns in the User record
-                user.update_standardized_metadata(details)
-                cached_count += 1
+        # Resolve each user's identifier once, reading the ORM rows up front
+        # (that may lazy-load them); users sharing an identifier share a fetch
+        identifiers = {
+            user.id: self._get_user_identifier_for_details(user) for user in users
+        }
+        usernames: dict = {}
+        for user in users:
+            if identifiers[user.id]:
+                usernames.setdefault(identifiers[user.id], user.username)
+        if not usernames:
+            return
 
+        def fetch(user_identifier):
+            try:
+                # Some clients resolve library names from the DB while fetching
+                with app.app_context():
+                    return self.get_user_details(user_identifier)
             except Exception as e:
-                import logging
+                username = usernames[user_identifier]
+                logging.warning(f"Failed to cache metadata for user {username}: {e}")
+                return None
+
+        workers = min(_METADATA_FETCH_WORKERS, len(usernames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            details_by_identifier = dict(
+                zip(usernames, executor.map(fetch, usernames), strict=True)
+            )
 
+        rows = []
+        for user in users:
+            details = details_by_identifier.get(identifiers[user.id])
+            if details is None:
+                continue
+            try:
+                values = user.standardized_metadata(details)
+            except Exception as e:
                 logging.warning(
                     f"Failed to cache metadata for user {user.username}: {e}"
                 )
                 continue
+            if values is not None:
+                rows.append({"id": user.id, **values})
 
-        if cached_count > 0:
+        if rows:
             try:
+                # ORM bulk UPDATE by primary key - one executemany for the batch
+                db.session.execute(update(User), rows)
                 db.session.commit()
-                import logging
-
-                logging.info(f"Cached metadata for {cached_count} users")
+                logging.info(f"Cached metadata for {len(rows)} users")
             except Exception as e:
-                import logging
-
                 logging.error(f"Failed to commit metadata cache: {e}")
                 db.session.rollback()
 
@@ -310,12 +685,10 @@ class MediaClient(ABC):
         # Default implementation uses token (works for most servers)
         return user.token if user.token else None
 
-    @abstractmethod
     def list_users(self, *args, **kwargs):
         """Return a list of users for this media server. Subclasses must implement."""
         raise NotImplementedError
 
-    @abstractmethod
     def now_playing(self):
         """Return a list of currently playing sessions for this media server.
 
@@ -351,7 +724,7 @@ class MediaClient(ABC):
         # Subclasses should override this method
         return []
 
-    @abstractmethod
+    @record_statistics
     def statistics(self):
         """Return comprehensive server statistics including library counts, user activity, etc.
 
@@ -367,6 +740,7 @@ class MediaClient(ABC):
         """
         raise NotImplementedError
 
+    @cached_per_server
     def get_user_count(self) -> int:
         """Get lightweight user count without triggering full user sync.
 
@@ -378,11 +752,12 @@ class MediaClient(ABC):
         """
         # Default implementation uses existing statistics() but subclasses should override
         try:
-            stats = self.statistics()
+            stats = _recorded_statistics(self) or self.statistics()
             return stats.get("user_stats", {}).get("total_users", 0)
         except Exception:
             return 0
 
+    @cached_per_server
     def get_server_info(self) -> dict:
         """Get lightweight server information without triggering user sync.
 
@@ -394,7 +769,7 @@ class MediaClient(ABC):
         """
         # Default implementation uses existing statistics() but subclasses should override
         try:
-            stats = self.statistics()
+            stats = _recorded_statistics(self) or self.statistics()
             return {
                 "version": stats.get("server_stats", {}).get("version", "Unknown"),
                 "transcoding_sessions": stats.get("server_stats", {}).get(
@@ -411,6 +786,7 @@ class MediaClient(ABC):
                 "active_sessions": 0,
             }
 
+    @prefer_cached_statistics
     def get_readonly_statistics(self) -> dict:
         """Get lightweight statistics for health monitoring without database writes.
 
@@ -449,21 +825,20 @@ class MediaClient(ABC):
         # Call the concrete implementation
         success, message = self._do_join(username, password, confirm, code)
 
-        # Send notification on successful join
+        # Send notification on successful join - in the background, so a slow
+        # notification agent doesn't hold up the user's join response
         if success:
-            try:
-                notify(
-                    "New User",
-                    f"User {username} has joined your server! 🎉",
-                    tags="tada",
-                    event_type="user_joined",
-                )
-            except Exception as e:
-                logging.warning(f"Failed to send join notification: {e}")
+            _NOTIFY_POOL.submit(
+                _safe_notify,
+                current_app._get_current_object(),
+                "New User",
+                f"User {username} has joined your server! 🎉",
+                tags="tada",
+                event_type="user_joined",
+            )
 
         return success, message
 
-    @abstractmethod
     def _do_join(
         self, username: str, password: str, confirm: str, code: str
     ):
@@ -483,7 +858,6 @@ class MediaClient(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def scan_libraries(self, url: str | None = None, token: str | None = None):
         """Scan available libraries on this media server.
 
@@ -528,7 +902,7 @@ class MediaClient(ABC):
 # ---------------------------------------------------------------------------
 
 
-class RestApiMixin(MediaClient):
+class RestApiMixin(MediaClient, abstract=True):
     """Mixin that adds minimal HTTP helpers for JSON-based REST APIs.
 
     Subclasses only need to implement ``_headers`` if they require
@@ -541,28 +915,67 @@ class RestApiMixin(MediaClient):
     # Customisation hooks
     # ------------------------------------------------------------------
 
+    # ``_headers()`` is memoised per (url, token); subclasses whose headers
+    # change independently of those (e.g. a refreshed session token) opt out.
+    _cache_default_headers = True
+
     def _headers(self) -> dict[str, str]:  # noqa: D401
         """Return default headers for every request (override as needed)."""
         return {
             "Accept": "application/json",
         }
 
+    @property
+    def _base_url(self) -> str:
+        """``self.url`` without a trailing slash, recomputed only on change."""
+        url = self.url
+        if url is None:
+            raise ValueError("Media server URL is not configured")
+        cached = self.__dict__.get("_base_url_cache")
+        if cached is None or cached[0] is not url:
+            cached = self._base_url_cache = (url, url.rstrip("/"))
+        return cached[1]
+
+    def _url(self, template: str, **params) -> str:
+        """Absolute URL for a path *template* such as ``"/Items/{item_id}"``.
+
+        Only the template is formatted, so braces in the base URL (e.g. a
+        reverse-proxy path) are kept verbatim.
+        """
+        path = template.format_map(params) if params else template
+        return self._base_url + path
+
+    @property
+    def _default_headers(self) -> dict[str, str]:
+        """Result of ``_headers()``, rebuilt only when url or token change."""
+        if not self._cache_default_headers:
+            return self._headers()
+        key = (self.url, self.token)
+        cached = self.__dict__.get("_default_headers_cache")
+        if cached is None or cached[0] != key:
+            cached = self._default_headers_cache = (key, self._headers())
+        return cached[1]
+
     # ------------------------------------------------------------------
     # Thin wrappers around ``requests`` so subclasses never import it
     # ------------------------------------------------------------------
 
+    @property
+    def _session(self) -> requests.Session:
+        """Shared keep-alive session (one connection pool per server host)."""
+        return _HTTP_SESSION
+
     def _request(self, method: str, path: str, **kwargs):
         """Make HTTP request with consistent error handling and logging."""
-        if self.url is None:
-            raise ValueError("Media server URL is not configured")
-
-        url = f"{self.url.rstrip('/')}{path}"
-        headers = {**self._headers(), **kwargs.pop("headers", {})}
+        url = self._base_url + path
+        headers = self._default_headers
+        if extra := kwargs.pop("headers", None):
+            headers = {**headers, **extra}
 
         logging.info("%s %s", method.upper(), url)
         try:
-            response = requests.request(
-                method, url, headers=headers, timeout=10, **kwargs
+            response = self._session.request(
+                method, url, headers=headers, timeout=_HTTP_TIMEOUT, **kwargs
             )
             logging.info("→ %s", response.status_code)
             response.raise_for_status()
@@ -571,6 +984,16 @@ class RestApiMixin(MediaClient):
             logging.error("Request failed: %s", e)
             raise
 
+    @staticmethod
+    def _json(response):
+        """Decode a JSON response body straight from its raw bytes.
+
+        ``json.loads`` detects UTF-8/16/32 itself, so this skips the text
+        decode (and any charset sniffing) ``Response.json()`` goes through –
+        noticeable on multi-megabyte user lists.
+        """
+        return json.loads(response.content)
+
     # Convenience helpers ------------------------------------------------
 
     def get(self, path: str, **kwargs):
@@ -592,3 +1015,38 @@ class RestApiMixin(MediaClient):
     def put(self, path: str, **kwargs):
         """Make PUT request to API endpoint."""
         return self._request("PUT", path, **kwargs)
+
+    def _paginated_get(
+        self,
+        path: str,
+        params: dict | None = None,
+        *,
+        page_key: str = "offset",
+        size_key: str = "limit",
+        size: int = 200,
+    ):
+        """Yield every item of a paginated list endpoint.
+
+        Pages of *size* items are requested with ``page_key`` (the item offset)
+        and ``size_key`` until a short page signals the end.  Pages wrapped as
+        ``{"items": [...]}`` are unwrapped; any other non-list payload stops
+        the iteration with a warning.
+        """
+        offset = 0
+        while True:
+            page = self._json(
+                self.get(
+                    path, params={**(params or {}), size_key: size, page_key: offset}
+                )
+            )
+            if isinstance(page, dict) and "items" in page:
+                page = page["items"]
+            if not isinstance(page, list):
+                logging.warning("Unexpected payload from %s: %s", path, page)
+                return
+
+            yield from page
+
+            if len(page) < size:
+                return  # reached final page
+            offset += size
@@ -14,7 +14,7 @@ from sqlalchemy import or_
 from app.extensions import db
 from app.models import Invitation, User
 from app.services.invites import is_invite_valid
-from app.services.media.client_base import RestApiMixin, register_media_client
+from app.services.media.client_base import RestApiMixin
 
 if TYPE_CHECKING:
     from app.services.media.user_details import MediaUserDetails
@@ -23,8 +23,7 @@ if TYPE_CHECKING:
 EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
 
 
-@register_media_client("drop")
-class DropClient(RestApiMixin):
+class DropClient(RestApiMixin, server_type="drop"):
     """Drop media server client using System token authentication."""
 
     def __init__(self, *args, **kwargs):
@@ -92,7 +91,7 @@ class DropClient(RestApiMixin):
         try:
             # Get users from Drop API
             response = self.get("/api/v1/admin/users")
-            remote_users: list[dict[str, Any]] = response.json()
+            remote_users: list[dict[str, Any]] = self._json(response)
 
             if not isinstance(remote_users, list):
                 logging.warning(
@@ -499,7 +498,8 @@ class DropClient(RestApiMixin):
                     "code": code,
                     "expires": expires,
                     "server_id": getattr(self, "server_id", None),
-                }
+                },
+                invitation=inv,
             )
             db.session.commit()
 
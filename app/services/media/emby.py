@@ -7,7 +7,6 @@ from sqlalchemy import or_
 
 from app.models import Invitation, MediaServer, User
 
-from .client_base import register_media_client
 from .jellyfin import JellyfinClient
 
 if TYPE_CHECKING:
@@ -17,8 +16,7 @@ if TYPE_CHECKING:
 EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
 
 
-@register_media_client("emby")
-class EmbyClient(JellyfinClient):
+class EmbyClient(JellyfinClient, server_type="emby"):
     """Wrapper around the Emby REST API using credentials from Settings."""
 
     def libraries(self) -> dict[str, str]:
@@ -144,7 +142,9 @@ class EmbyClient(JellyfinClient):
                     item_id = item.get("Id")
                     if item_id:
                         # Build poster URL for Emby
-                        poster_url = f"{self.url}/Items/{item_id}/Images/Primary"
+                        poster_url = self._url(
+                            "/Items/{item_id}/Images/Primary", item_id=item_id
+                        )
                         if self.token:
                             poster_url += f"?api_key={self.token}"
                         poster_urls.append(poster_url)
@@ -10,7 +10,7 @@ from app.extensions import db
 from app.models import Invitation, Library, User
 from app.services.invites import is_invite_valid
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 from .utils import (
     DateHelper,
     LibraryAccessHelper,
@@ -24,8 +24,7 @@ if TYPE_CHECKING:
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}$")
 
 
-@register_media_client("jellyfin")
-class JellyfinClient(RestApiMixin):
+class JellyfinClient(RestApiMixin, server_type="jellyfin"):
     """Wrapper around the Jellyfin REST API using credentials from Settings."""
 
     def __init__(self, *args, **kwargs):
@@ -213,7 +212,7 @@ class JellyfinClient(RestApiMixin):
 
     def list_users(self) -> list[User]:
         server_id = getattr(self, "server_id", None)
-        raw_users = self.get("/Users").json()
+        raw_users = self._json(self.get("/Users"))
         jf_users = {u["Id"]: u for u in raw_users}
 
         for jf in jf_users.values():
@@ -498,7 +497,8 @@ class JellyfinClient(RestApiMixin):
                     "code": code,
                     "expires": expires,
                     "server_id": server_id,
-                }
+                },
+                invitation=inv,
             )
             db.session.commit()
 
@@ -528,13 +528,17 @@ class JellyfinClient(RestApiMixin):
         base_params = f"?api_key={self.token}" if self.token else ""
 
         # Primary artwork for the item (poster)
-        artwork_url = f"{self.url}/Items/{poster_item_id}/Images/Primary{base_params}"
+        artwork_url = (
+            self._url("/Items/{item_id}/Images/Primary", item_id=poster_item_id)
+            + base_params
+        )
         fallback_artwork_url = artwork_url
 
         # For episodes/series, also try to get a backdrop image as thumbnail
         # But use Primary as fallback to avoid another potentially slow call
         thumbnail_url = (
-            f"{self.url}/Items/{poster_item_id}/Images/Backdrop{base_params}"
+            self._url("/Items/{item_id}/Images/Backdrop", item_id=poster_item_id)
+            + base_params
         )
 
         return {
@@ -568,7 +572,9 @@ class JellyfinClient(RestApiMixin):
                     item_id = item.get("Id")
                     if item_id:
                         # Build poster URL
-                        poster_url = f"{self.url}/Items/{item_id}/Images/Primary"
+                        poster_url = self._url(
+                            "/Items/{item_id}/Images/Primary", item_id=item_id
+                        )
                         if self.token:
                             poster_url += f"?api_key={self.token}"
                         poster_urls.append(poster_url)
@@ -746,7 +752,10 @@ class JellyfinClient(RestApiMixin):
 
                 # Use Primary image for vertical posters
                 if image_tags.get("Primary"):
-                    thumb_url = f"{self.url}/Items/{item['Id']}/Images/Primary?maxHeight=400&quality=90"
+                    thumb_url = self._url(
+                        "/Items/{item_id}/Images/Primary?maxHeight=400&quality=90",
+                        item_id=item["Id"],
+                    )
                     if self.token:
                         thumb_url += f"&api_key={self.token}"
 
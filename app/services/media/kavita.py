@@ -12,7 +12,7 @@ from app.extensions import db
 from app.models import Invitation, User
 from app.services.invites import is_invite_valid
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 from .utils import (
     DateHelper,
     LibraryAccessHelper,
@@ -29,8 +29,7 @@ EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}$")
 _JWT_TOKEN_CACHE = {}
 
 
-@register_media_client("kavita")
-class KavitaClient(RestApiMixin):
+class KavitaClient(RestApiMixin, server_type="kavita"):
     """Wrapper around the Kavita REST API for manga/comic management."""
 
     def __init__(self, *args, **kwargs):
@@ -83,6 +82,9 @@ class KavitaClient(RestApiMixin):
 
     # RestApiMixin overrides -------------------------------------------
 
+    # The bearer JWT is refreshed on expiry, so headers can't be memoised
+    _cache_default_headers = False
+
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
 
@@ -509,7 +511,7 @@ class KavitaClient(RestApiMixin):
                 return []
 
             try:
-                kavita_users = response.json()
+                kavita_users = self._json(response)
             except Exception as json_exc:
                 logging.error(f"Failed to decode Kavita users JSON: {json_exc}")
                 return []
@@ -647,7 +649,8 @@ class KavitaClient(RestApiMixin):
                     "code": code,
                     "expires": expires,
                     "server_id": current_server_id,
-                }
+                },
+                invitation=inv,
             )
             db.session.commit()
 
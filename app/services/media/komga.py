@@ -13,13 +13,12 @@ from app.extensions import db
 from app.models import Invitation, Library, User
 from app.services.invites import is_invite_valid
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}$")
 
 
-@register_media_client("komga")
-class KomgaClient(RestApiMixin):
+class KomgaClient(RestApiMixin, server_type="komga"):
     """Wrapper around the Komga REST API using credentials from Settings."""
 
     def __init__(self, *args, **kwargs):
@@ -165,7 +164,7 @@ class KomgaClient(RestApiMixin):
         """Sync users from Komga into the local DB and return the list of User records."""
         try:
             response = self.get("/api/v1/users")
-            komga_users = {u["id"]: u for u in response.json()}
+            komga_users = {u["id"]: u for u in self._json(response)}
 
             for komga_user in komga_users.values():
                 existing = User.query.filter_by(token=komga_user["id"]).first()
@@ -291,7 +290,8 @@ class KomgaClient(RestApiMixin):
                     "code": code,
                     "expires": expires,
                     "server_id": current_server_id,
-                }
+                },
+                invitation=inv,
             )
             db.session.commit()
 
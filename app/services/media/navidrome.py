@@ -14,14 +14,13 @@ from app.models import Invitation, User
 from app.services.invites import is_invite_valid
 from app.services.media.utils import StandardizedPermissions
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 
 if TYPE_CHECKING:
     from app.services.media.user_details import MediaUserDetails
 
 
-@register_media_client("navidrome")
-class NavidromeClient(RestApiMixin):
+class NavidromeClient(RestApiMixin, server_type="navidrome"):
     """Navidrome wrapper using the Subsonic API."""
 
     #: API prefix for Subsonic/OpenSubsonic endpoints
@@ -13,7 +13,7 @@ from app.models import Invitation, Library, MediaServer, User
 from app.services.media.service import get_client_for_media_server
 from app.services.notifications import notify
 
-from .client_base import MediaClient, register_media_client
+from .client_base import MediaClient
 
 if TYPE_CHECKING:
     from app.services.media.user_details import MediaUserDetails
@@ -138,8 +138,7 @@ class PlexInvitationError(Exception):
         super().__init__(message)
 
 
-@register_media_client("plex")
-class PlexClient(MediaClient):
+class PlexClient(MediaClient, server_type="plex"):
     """Wrapper that connects to Plex using admin credentials."""
 
     def __init__(self, *args, **kwargs):
@@ -1108,7 +1107,8 @@ def handle_oauth_token(app, token: str, code: str) -> None:
                 "code": code,
                 "expires": expires,
                 "server_id": server_id,
-            }
+            },
+            invitation=inv,
         )
         db.session.commit()
 
@@ -16,7 +16,7 @@ from app.extensions import db
 from app.models import Invitation, User
 from app.services.invites import is_invite_valid
 
-from .client_base import RestApiMixin, register_media_client
+from .client_base import RestApiMixin
 
 """Romm media‐server client.
 
@@ -44,8 +44,7 @@ needs:
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}$")
 
 
-@register_media_client("romm")
-class RommClient(RestApiMixin):
+class RommClient(RestApiMixin, server_type="romm"):
     """Very small wrapper around the RomM REST API."""
 
     API_PREFIX = "/api"
@@ -118,31 +117,17 @@ class RommClient(RestApiMixin):
         Requires the supplied API token to belong to a RomM *admin* user as
         `/api/users` is admin-only.
         """
-        # RomM supports pagination via ?skip= & take= parameters.  We fetch in
-        # chunks of *take*=100 until the returned set is smaller than the
-        # requested size, indicating we've reached the end.
-
-        remote_users: list[dict[str, Any]] = []
-        skip, take = 0, 100
+        # RomM supports pagination via ?skip= & take= parameters.  Some RomM
+        # versions wrap each page in {"items": [...]} – the helper handles both.
         try:
-            while True:
-                r = self.get(
-                    f"{self.API_PREFIX}/users", params={"skip": skip, "take": take}
+            remote_users: list[dict[str, Any]] = list(
+                self._paginated_get(
+                    f"{self.API_PREFIX}/users",
+                    page_key="skip",
+                    size_key="take",
+                    size=100,
                 )
-                batch: list[dict[str, Any]] = r.json()
-                # Some RomM versions wrap the list in {"items": [...]} – handle both.
-                if isinstance(batch, dict) and "items" in batch:
-                    batch = batch["items"]  # type: ignore[assignment]
-
-                if not isinstance(batch, list):
-                    logging.warning("ROMM: unexpected /users payload: %s", batch)
-                    break
-
-                remote_users.extend(batch)
-
-                if len(batch) < take:
-                    break  # reached final page
-                skip += take
+            )
         except Exception as exc:  # noqa: BLE001
             logging.warning("ROMM: failed to list users – %s", exc, exc_info=True)
             return []
@@ -478,7 +463,8 @@ class RommClient(RestApiMixin):
                     "code": code,
                     "expires": expires,
                     "server_id": getattr(self, "server_id", None),
-                }
+                },
+                invitation=inv,
             )
             db.session.commit()
 
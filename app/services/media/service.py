@@ -8,11 +8,44 @@ dispatches requests to the appropriate media client implementation.
 import logging
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
 
 from app.extensions import db
 from app.models import Identity, MediaServer, Settings, User
 
-from .client_base import CLIENTS
+from .client_base import CLIENTS, MediaClient
+
+# Upper bound on servers queried at once by call_on_clients()
+_FANOUT_WORKERS = 8
+
+
+def call_on_clients(clients: list[MediaClient], method: str) -> list:
+    """Call the no-argument *method* on every client concurrently.
+
+    Media-server calls are network-bound, so a dashboard covering several
+    servers waits for the slowest one instead of the sum of all of them.
+    Each call runs in its own app context (clients may read the database).
+
+    Returns:
+        list: One entry per client, in order – the method's return value, or
+              the exception it raised.
+    """
+    if not clients:
+        return []
+
+    app = current_app._get_current_object()
+
+    def call(client):
+        try:
+            with app.app_context():
+                return getattr(client, method)()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=min(_FANOUT_WORKERS, len(clients))) as ex:
+        return list(ex.map(call, clients))
 
 
 def _clear_user_cache(client) -> None:
@@ -383,27 +416,25 @@ def get_now_playing_all_servers():
     """
     all_sessions = []
 
-    # Get all configured media servers
-    servers = db.session.query(MediaServer).all()
-
-    for server in servers:
-        try:
-            client = get_client_for_media_server(server)
-            sessions = client.now_playing()
-
-            # Add server information to each session
-            for session in sessions:
-                session["server_name"] = server.name
-                session["server_type"] = server.server_type
-                session["server_id"] = server.id
-                all_sessions.append(session)
-
-        except Exception as exc:
+    # Clients for all configured media servers, resolved in a single query
+    clients = MediaClient.load_all()
+    for client, sessions in zip(
+        clients, call_on_clients(clients, "now_playing"), strict=True
+    ):
+        server = client.server_row
+        if isinstance(sessions, Exception):
             logging.warning(
-                f"Failed to get now playing from server {server.name} ({server.server_type}): {exc}"
+                f"Failed to get now playing from server {server.name} ({server.server_type}): {sessions}"
             )
             continue
 
+        # Add server information to each session
+        for session in sessions:
+            session["server_name"] = server.name
+            session["server_type"] = server.server_type
+            session["server_id"] = server.id
+            all_sessions.append(session)
+
     return all_sessions
 
 
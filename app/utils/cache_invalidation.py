@@ -0,0 +1,69 @@
+"""
+Drop process-local caches once writes to the rows they mirror are committed.
+
+Mapper events such as ``after_update`` fire during flush, before the
+transaction commits. Clearing a cache there lets a concurrent reader refill it
+from the old committed rows, and a later rollback would have cleared a cache
+that was still valid. Instead, writes are noted on the session while it
+flushes and the callbacks run from ``after_commit``.
+"""
+
+from collections.abc import Callable
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# model class -> callbacks to run after a commit that wrote one of its rows
+_CALLBACKS: dict[type, list[Callable[[], None]]] = {}
+
+# session.info key holding the callbacks owed by the current transaction
+_PENDING_KEY = "pending_cache_invalidations"
+
+
+def invalidate_on_commit(*models: type):
+    """Call the decorated function after every commit that wrote any of *models*.
+
+    Covers ORM flushes as well as legacy ``Query.update()``/``Query.delete()``
+    bulk statements. Nothing is called when the transaction rolls back.
+    """
+
+    def decorator(fn):
+        for model in models:
+            _CALLBACKS.setdefault(model, []).append(fn)
+        return fn
+
+    return decorator
+
+
+def _mark(session: Session, model: type | None) -> None:
+    if callbacks := _CALLBACKS.get(model):  # type: ignore[arg-type]
+        session.info.setdefault(_PENDING_KEY, set()).update(callbacks)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_writes(session, _flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here
+    for obj in chain(session.new, session.dirty, session.deleted):
+        _mark(session, type(obj))
+
+
+@event.listens_for(Session, "after_bulk_update")
+@event.listens_for(Session, "after_bulk_delete")
+def _note_bulk_writes(bulk_context) -> None:
+    # Query.update()/delete() bypass the flush entirely
+    _mark(bulk_context.session, getattr(bulk_context.mapper, "class_", None))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending(session) -> None:
+    for callback in session.info.pop(_PENDING_KEY, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending(session, transaction) -> None:
+    # Only the outermost transaction decides; a rolled-back SAVEPOINT may
+    # share the session with writes that still commit
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
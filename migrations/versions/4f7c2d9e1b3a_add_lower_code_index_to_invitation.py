@@ -0,0 +1,29 @@
+"""Add lower(code) index to invitation table
+
+Revision ID: 4f7c2d9e1b3a
+Revises: 26eb28c751e1
+Create Date: 2025-10-15 09:12:44.301927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f7c2d9e1b3a'
+down_revision = '26eb28c751e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_invitation_code_lower',
+        'invitation',
+        [sa.text('lower(code)')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_invitation_code_lower', table_name='invitation')
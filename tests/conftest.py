@@ -1,28 +1,117 @@
+import os
 import tempfile
 
 import pytest
+import werkzeug.security
+from flask.globals import app_ctx
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app import create_app
 from app.config import BaseConfig
 from app.extensions import db
+from app.models import AdminAccount
+from app.services.jellyfin_auth import (
+    _breakers,
+    clear_auth_cache,
+    invalidate_jellyfin_server_cache,
+)
+from app.services.media.client_base import (
+    invalidate_server_credentials_cache,
+    invalidate_server_info_cache,
+)
+from app.utils.session_cache import RobustFileSystemCache
+
+# Set by pytest-xdist; keeps file-backed databases apart between workers
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
 
 
 class TestConfig(BaseConfig):
     TESTING = True
     WTF_CSRF_ENABLED = False
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # An in-memory database lives only as long as its connection: every
+    # session and db_session transaction must share this one. Tests whose
+    # threads run their own transactions use ThreadedTestConfig instead
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+
+
+class ThreadedTestConfig(TestConfig):
+    """Config for tests whose worker threads use the database concurrently.
+
+    Threads sharing the single in-memory connection would also share its
+    transaction state, so each test gets a real file (see ``threaded_app``)
+    and the default pool hands every thread a connection of its own.
+    """
+
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {}
 
 
 class E2ETestConfig(BaseConfig):
     TESTING = True
     WTF_CSRF_ENABLED = False
     # Use a temporary file database that both test process and live server can access
-    SQLALCHEMY_DATABASE_URI = f"sqlite:///{tempfile.gettempdir()}/wizarr_e2e_test.db"
+    SQLALCHEMY_DATABASE_URI = (
+        f"sqlite:///{tempfile.gettempdir()}/wizarr_e2e_test_{XDIST_WORKER}.db"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash passwords with a single PBKDF2 round instead of scrypt.
+
+    Hashes stay in werkzeug's format, so ``check_password_hash`` keeps working
+    unchanged; only the (deliberately slow) work factor is dropped.
+    """
+    real_generate = werkzeug.security.generate_password_hash
+
+    def generate(password, method="scrypt", salt_length=16):
+        return real_generate(password, "pbkdf2:sha256:1", salt_length)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(werkzeug.security, "generate_password_hash", generate)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_files(tmp_path_factory):
+    """Keep Flask-Session's files out of the checkout's ``database/`` folder.
+
+    Patched on ``BaseConfig`` so it also reaches the per-module configs.
+    """
+    cache = RobustFileSystemCache(str(tmp_path_factory.mktemp("sessions")))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BaseConfig, "SESSION_CACHELIB", cache)
+        yield
+
+
+@pytest.fixture(scope="session")
+def make_account(fast_password_hashing):
+    """Build unsaved ``AdminAccount`` rows whose password is ``Password123``.
+
+    The hash is computed once for the session and shared by every account, so
+    creating test accounts costs no hashing at all.
+    """
+    password_hash = werkzeug.security.generate_password_hash("Password123")
+
+    def make(username, role="admin"):
+        return AdminAccount(username=username, role=role, password_hash=password_hash)
+
+    return make
 
 
 @pytest.fixture(scope="session")
 def app():
     app = create_app(TestConfig)  # type: ignore[arg-type]
+    # The session-wide app keeps parsed templates in jinja_env.cache; the
+    # bytecode cache also lets later runs skip compiling unchanged templates
+    cache_dir = os.path.join(tempfile.gettempdir(), "wizarr_test_jinja_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
     with app.app_context():
         db.create_all()
     yield app
@@ -31,10 +120,115 @@ def app():
 
 
 @pytest.fixture
+def threaded_app(tmp_path):
+    """A fresh app on its own SQLite file, for tests that start worker threads.
+
+    Concurrent transactions on the shared in-memory connection trip over each
+    other's SAVEPOINTs, so these tests get one connection per thread instead
+    and are left out of the ``db_session`` rollback; the file goes with
+    ``tmp_path``.
+    """
+
+    class Config(ThreadedTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'threaded.db'}"
+
+    app = create_app(Config)  # type: ignore[arg-type]
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def db_session(request, app):
+    """Run every test inside a transaction that is rolled back afterwards.
+
+    ``db.session`` is rebound to a connection holding an outer transaction;
+    commits made by the test (or by views it calls) only release SAVEPOINTs,
+    so every row written during the test disappears on teardown without
+    rebuilding the schema.
+    """
+    if "sqlalchemy" not in app.extensions or "threaded_app" in request.fixturenames:
+        # Modules that override ``app`` with a bare Flask app have no database;
+        # threaded tests bring their own
+        yield None
+        return
+
+    with app.app_context():
+        connection = db.engine.connect()
+        dbapi_connection = connection.connection.driver_connection
+        isolation_level = dbapi_connection.isolation_level
+        # pysqlite only emits BEGIN lazily before writes, which would let the
+        # test's commits escape the outer transaction - issue it ourselves
+        dbapi_connection.isolation_level = None
+        transaction = connection.begin()
+        connection.exec_driver_sql("BEGIN")
+        original_session = db.session
+        # A plain sessionmaker: Flask-SQLAlchemy's Session.get_bind() would
+        # route queries back to the engine instead of this connection
+        db.session = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode="create_savepoint"),
+            scopefunc=lambda: id(app_ctx._get_current_object()),
+        )
+        try:
+            yield db.session
+        finally:
+            db.session.remove()
+            db.session = original_session
+            transaction.rollback()
+            dbapi_connection.isolation_level = isolation_level
+            connection.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Empty the process-wide caches after every test.
+
+    Rolling back fires no commit events, so entries filled from rows a test
+    wrote would outlive them; cached Jellyfin logins and open circuit breakers
+    would likewise carry into whichever test runs next.
+    """
+    yield
+    invalidate_jellyfin_server_cache()
+    invalidate_server_credentials_cache()
+    invalidate_server_info_cache()
+    clear_auth_cache()
+    _breakers.clear()
+
+
+@pytest.fixture
+def app_context(app):
+    """Push an application context for the whole test.
+
+    Requests made through the test client reuse it instead of pushing their
+    own, so tests need no ``with app.app_context():`` block of their own.
+    """
+    with app.app_context():
+        yield
+
+
+@pytest.fixture(scope="module")
 def client(app):
+    # Shared by the module's tests; _logged_out_client resets it between them
     return app.test_client()
 
 
+@pytest.fixture(autouse=True)
+def _logged_out_client(request):
+    """Start every test that uses ``client`` without a login session."""
+    if "client" not in request.fixturenames:
+        yield
+        return
+    client = request.getfixturevalue("client")
+    # Clear the whole jar: any cookie a previous test picked up (language,
+    # flashed state, ...) could otherwise leak into this one. Werkzeug has no
+    # public way to list the jar, so walk its private dict
+    for cookie in list(client._cookies.values()):
+        client.delete_cookie(cookie.key, domain=cookie.domain, path=cookie.path)
+    yield
+
+
 @pytest.fixture
 def runner(app):
     return app.test_cli_runner()
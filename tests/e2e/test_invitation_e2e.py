@@ -21,19 +21,25 @@ from tests.mocks.media_server_mocks import (
     setup_mock_servers,
 )
 
+# One database file per pytest-xdist worker so parallel runs don't collide
+TEST_DB_PATH = (
+    f"{tempfile.gettempdir()}/wizarr_e2e_test_"
+    f"{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}.db"
+)
+
 
 class E2ETestConfig(BaseConfig):
     TESTING = True
     WTF_CSRF_ENABLED = False
     # Use a temporary file database that both test process and live server can access
-    SQLALCHEMY_DATABASE_URI = f"sqlite:///{tempfile.gettempdir()}/wizarr_e2e_test.db"
+    SQLALCHEMY_DATABASE_URI = f"sqlite:///{TEST_DB_PATH}"
 
 
 @pytest.fixture(scope="session")
 def app():
     """Create app with file-based database for E2E tests."""
     # Clean up any existing test database
-    test_db_path = f"{tempfile.gettempdir()}/wizarr_e2e_test.db"
+    test_db_path = TEST_DB_PATH
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
 
@@ -33,6 +33,13 @@ def test_guest_account_creation(app):
         assert fetched.is_admin() is False
 
 
+def test_account_without_password_hash_has_no_usable_password():
+    """An account with no stored hash can't log in with a local password."""
+    acc = AdminAccount(username="no_hash", role="guest")
+    assert acc.has_usable_password() is False
+    assert acc.check_password("anything") is False
+
+
 def test_admin_login(client, app):
     """POST /login authenticates an AdminAccount and redirects home."""
     with app.app_context():
@@ -0,0 +1,50 @@
+"""Tests for ETag revalidation of the polled dashboard cards."""
+
+from datetime import UTC, datetime
+
+from app.extensions import db
+from app.models import Invitation
+
+CARD_URL = "/accepted-invites-card"
+
+
+def _login_admin(client, make_account, username):
+    db.session.add(make_account(username, "admin"))
+    db.session.flush()
+    resp = client.post("/login", data={"username": username, "password": "Password123"})
+    assert resp.status_code in {302, 303}
+
+
+def test_accepted_invites_card_answers_304_until_something_changes(
+    client, make_account
+):
+    """Test that only the same user with unchanged data gets a 304."""
+    _login_admin(client, make_account, "etag_admin")
+
+    first = client.get(CARD_URL)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    again = client.get(CARD_URL, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+
+    # A newly accepted invitation changes the token
+    db.session.add(
+        Invitation(
+            code="ETAG01",
+            used=True,
+            used_at=datetime(2024, 1, 2, tzinfo=UTC),
+            created=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+    )
+    db.session.flush()
+    changed = client.get(CARD_URL, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert b"Showing 1-1 of 1" in changed.data
+    etag = changed.headers["ETag"]
+    assert client.get(CARD_URL, headers={"If-None-Match": etag}).status_code == 304
+
+    # The tag covers the user, so another admin's copy never validates
+    _login_admin(client, make_account, "etag_other_admin")
+    assert client.get(CARD_URL, headers={"If-None-Match": etag}).status_code == 200
@@ -433,3 +433,82 @@ class TestIdentityLinkingFix:
             assert user.identity_id is None
             assert user.code == ""
             assert user.username == "test_user"
+
+    def test_batch_creation_links_like_single_creation(self, app):
+        """Test that the batch helper applies the same linking rules in one pass."""
+        with app.app_context():
+            self.setup_method()
+
+            limited = create_invite(
+                {
+                    "server_ids": [str(self.server1.id)],
+                    "unlimited": False,
+                    "expires": "never",
+                }
+            )
+            unlimited = create_invite(
+                {
+                    "server_ids": [str(self.server1.id)],
+                    "unlimited": True,
+                    "expires": "never",
+                }
+            )
+            mock_client1 = MockMediaClient(media_server=self.server1)
+            mock_client2 = MockMediaClient(media_server=self.server2)
+
+            identity = Identity(
+                primary_email="ann@example.com", primary_username="ann"
+            )
+            db.session.add(identity)
+            db.session.flush()
+            for code, email, token in (
+                (limited.code, "ann@example.com", "batch1"),
+                (unlimited.code, "ann@example.com", "batch2"),
+            ):
+                user = mock_client1._create_user_with_identity_linking(
+                    {
+                        "username": "ann",
+                        "email": email,
+                        "code": code,
+                        "server_id": self.server1.id,
+                        "token": token,
+                    }
+                )
+                user.identity_id = identity.id
+            db.session.commit()
+
+            users = mock_client2._create_users_with_identity_linking(
+                [
+                    {
+                        "username": "ann_limited",
+                        "email": "other@example.com",
+                        "code": limited.code,
+                        "server_id": self.server2.id,
+                        "token": "batch3",
+                    },
+                    {
+                        "username": "ann_unlimited",
+                        "email": "ann@example.com",
+                        "code": unlimited.code,
+                        "server_id": self.server2.id,
+                        "token": "batch4",
+                    },
+                    {
+                        "username": "bob_unlimited",
+                        "email": "bob@example.com",
+                        "code": unlimited.code,
+                        "server_id": self.server2.id,
+                        "token": "batch5",
+                    },
+                ]
+            )
+            db.session.commit()
+
+            assert [u.username for u in users] == [
+                "ann_limited",
+                "ann_unlimited",
+                "bob_unlimited",
+            ]
+            assert users[0].identity_id == identity.id
+            assert users[1].identity_id == identity.id
+            assert users[2].identity_id is None
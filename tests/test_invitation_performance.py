@@ -75,9 +75,9 @@ class TestInvitationPerformance:
             )
 
     @patch("app.services.invitation_manager.get_client_for_media_server")
-    def test_concurrent_invitation_processing(self, mock_get_client, app):
+    def test_concurrent_invitation_processing(self, mock_get_client, threaded_app):
         """Test processing multiple invitations concurrently."""
-        with app.app_context():
+        with threaded_app.app_context():
             # Setup server and unlimited invitation
             server = MediaServer(
                 name="Concurrent Test Server",
@@ -103,7 +103,7 @@ class TestInvitationPerformance:
             def process_invitation(user_id):
                 # Small stagger to reduce SQLite concurrency conflicts
                 time.sleep(user_id * 0.01)  # 0-90ms stagger
-                with app.app_context():
+                with threaded_app.app_context():
                     success, redirect_code, errors = (
                         InvitationManager.process_invitation(
                             code="CONCURRENT123",
@@ -1,82 +1,126 @@
 """Tests for Jellyfin authentication integration."""
 
+from unittest.mock import patch
+
 import pytest
-import responses
-from unittest.mock import patch, MagicMock
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from app.extensions import db
 from app.models import AdminAccount, MediaServer
-from app.services.jellyfin_auth import authenticate_jellyfin_user, create_guest_account_from_jellyfin
+from app.services.jellyfin_auth import (
+    _BREAKER_THRESHOLD,
+    _SERVER_CACHE,
+    _authenticate_against_server,
+    _get_jellyfin_servers,
+    authenticate_jellyfin_user,
+    create_guest_account_from_jellyfin,
+    login_or_create_guest,
+)
 
+# Authentication endpoint of the jellyfin_server fixture
+_JF_AUTH_URL = "http://localhost:8096/Users/AuthenticateByName"
 
-def test_jellyfin_authentication_success(app):
-    """Test successful Jellyfin authentication."""
-    with app.app_context():
-        # Create a test Jellyfin server
-        server = MediaServer(
+# Body of a successful POST /Users/AuthenticateByName
+_JF_USER_PAYLOAD = {
+    "User": {
+        "Id": "test-user-id",
+        "Name": "testuser",
+        "HasPassword": True,
+        "HasConfiguredPassword": True,
+        "Policy": {},
+    },
+    "ServerId": "test-server-id",
+    "AccessToken": "test-access-token",
+}
+
+
+def _jf_payload(user_id="test-user-id", name="testuser"):
+    user = {**_JF_USER_PAYLOAD["User"], "Id": user_id, "Name": name}
+    return {**_JF_USER_PAYLOAD, "User": user}
+
+
+def assert_guest_account(account, *, username, user_id, server="Test Jellyfin"):
+    """Assert *account* is a guest linked to Jellyfin user *user_id* on *server*."""
+    assert account.username == username
+    assert account.role == "guest"
+    assert account.jellyfin_server == server
+    assert account.jellyfin_user_id == user_id
+
+
+@pytest.fixture
+def jellyfin_server(db_session):
+    """Id of the "Test Jellyfin" server, discarded with the test's transaction.
+
+    Inserted with a Core statement: the tests only need the row to exist, so
+    there is no ORM instance to build and track.
+    """
+    result = db_session.execute(
+        MediaServer.__table__.insert().values(
             name="Test Jellyfin",
             server_type="jellyfin",
             url="http://localhost:8096",
             api_key="test_key",
-            verified=True
+            verified=True,
         )
-        db.session.add(server)
-        db.session.commit()
-        
+    )
+    return result.inserted_primary_key[0]
+
+
+def test_jellyfin_authentication_success(app, jellyfin_server, requests_mock):
+    """Test successful Jellyfin authentication."""
+    with app.app_context():
         # Mock successful Jellyfin response
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.POST,
-                "http://localhost:8096/Users/AuthenticateByName",
-                json={
-                    "User": {
-                        "Id": "test-user-id",
-                        "Name": "testuser",
-                        "HasPassword": True,
-                        "HasConfiguredPassword": True,
-                        "Policy": {}
-                    },
-                    "ServerId": "test-server-id",
-                    "AccessToken": "test-access-token"
-                },
-                status=200
+        requests_mock.post(
+            _JF_AUTH_URL,
+            json=_jf_payload(),
+            status_code=200
+        )
+
+        success, server_name, user_info = authenticate_jellyfin_user("testuser", "testpass")
+
+        assert success is True
+        assert server_name == "Test Jellyfin"
+        assert user_info["id"] == "test-user-id"
+        assert user_info["name"] == "testuser"
+
+
+def test_jellyfin_authentication_prefers_servers_in_db_order(app, requests_mock):
+    """Test that a user known to several servers always resolves to the first one."""
+    with app.app_context():
+        for name, port in (("First Jellyfin", 18101), ("Second Jellyfin", 18102)):
+            db.session.add(
+                MediaServer(
+                    name=name,
+                    server_type="jellyfin",
+                    url=f"http://localhost:{port}",
+                    api_key="test_key",
+                    verified=True,
+                )
+            )
+            requests_mock.post(
+                f"http://localhost:{port}/Users/AuthenticateByName",
+                json=_jf_payload(),
+                status_code=200,
             )
-            
-            success, server_name, user_info = authenticate_jellyfin_user("testuser", "testpass")
-            
-            assert success is True
-            assert server_name == "Test Jellyfin"
-            assert user_info["id"] == "test-user-id"
-            assert user_info["name"] == "testuser"
+        db.session.flush()
+
+        success, server_name, _user_info = authenticate_jellyfin_user("testuser", "testpass")
 
+        assert success is True
+        assert server_name == "First Jellyfin"
 
-def test_jellyfin_authentication_invalid_credentials(app):
+
+def test_jellyfin_authentication_invalid_credentials(app, jellyfin_server, requests_mock):
     """Test Jellyfin authentication with invalid credentials."""
     with app.app_context():
-        # Create a test Jellyfin server
-        server = MediaServer(
-            name="Test Jellyfin",
-            server_type="jellyfin",
-            url="http://localhost:8096",
-            api_key="test_key",
-            verified=True
-        )
-        db.session.add(server)
-        db.session.commit()
-        
         # Mock failed Jellyfin response
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.POST,
-                "http://localhost:8096/Users/AuthenticateByName",
-                status=401
-            )
-            
-            success, server_name, user_info = authenticate_jellyfin_user("testuser", "wrongpass")
-            
-            assert success is False
-            assert server_name is None
-            assert user_info is None
+        requests_mock.post(_JF_AUTH_URL, status_code=401)
+
+        success, server_name, user_info = authenticate_jellyfin_user("testuser", "wrongpass")
+
+        assert success is False
+        assert server_name is None
+        assert user_info is None
 
 
 def test_create_guest_account_from_jellyfin(app):
@@ -87,123 +131,72 @@ def test_create_guest_account_from_jellyfin(app):
             "name": "testuser",
             "server_id": "test-server-id"
         }
-        
+
         account = create_guest_account_from_jellyfin("testuser", "Test Jellyfin", user_info)
-        
-        assert account.username == "testuser"
-        assert account.role == "guest"
-        assert account.jellyfin_server == "Test Jellyfin"
-        assert account.jellyfin_user_id == "test-user-id"
+
+        assert_guest_account(account, username="testuser", user_id="test-user-id")
         assert account.is_guest() is True
         assert account.is_admin() is False
+        assert account.check_password("") is False
+        assert account.check_password(account.password_hash) is False
 
 
-def test_jellyfin_login_creates_guest_account(client, app):
-    """Test that logging in with Jellyfin credentials creates a guest account."""
+@pytest.mark.usefixtures("jellyfin_server")
+def test_jellyfin_login_creates_guest_account(app, requests_mock):
+    """Test that a first Jellyfin login creates a linked guest account."""
     with app.app_context():
-        # Create a test Jellyfin server
-        server = MediaServer(
-            name="Test Jellyfin",
-            server_type="jellyfin",
-            url="http://localhost:8096",
-            api_key="test_key",
-            verified=True
-        )
-        db.session.add(server)
-        db.session.commit()
-        
         # Mock successful Jellyfin response
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.POST,
-                "http://localhost:8096/Users/AuthenticateByName",
-                json={
-                    "User": {
-                        "Id": "test-user-id",
-                        "Name": "jellyfinuser",
-                        "HasPassword": True,
-                        "HasConfiguredPassword": True,
-                        "Policy": {}
-                    },
-                    "ServerId": "test-server-id",
-                    "AccessToken": "test-access-token"
-                },
-                status=200
-            )
-            
-            # Attempt login with Jellyfin credentials
-            resp = client.post("/login", data={
-                "username": "jellyfinuser",
-                "password": "jellyfinpass"
-            })
-            
-            # Should redirect on successful login
-            assert resp.status_code in {302, 303}
-            
-            # Check that a guest account was created
-            account = AdminAccount.query.filter_by(username="jellyfinuser").first()
-            assert account is not None
-            assert account.role == "guest"
-            assert account.jellyfin_server == "Test Jellyfin"
-            assert account.jellyfin_user_id == "test-user-id"
-
-
-def test_existing_jellyfin_account_login(client, app):
-    """Test that existing Jellyfin-linked accounts can log in."""
+        requests_mock.post(
+            _JF_AUTH_URL,
+            json=_jf_payload(name="jellyfinuser"),
+            status_code=200
+        )
+
+        # The service behind /login, without the HTTP round trip
+        account = login_or_create_guest("jellyfinuser", "jellyfinpass")
+
+        assert account is not None
+        assert AdminAccount.query.filter_by(username="jellyfinuser").one() == account
+        assert_guest_account(account, username="jellyfinuser", user_id="test-user-id")
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("jellyfin_server")
+def test_existing_jellyfin_account_login(client, app, make_account, requests_mock):
+    """Test that existing Jellyfin-linked accounts can log in through /login."""
     with app.app_context():
-        # Create a test Jellyfin server
-        server = MediaServer(
-            name="Test Jellyfin",
-            server_type="jellyfin",
-            url="http://localhost:8096",
-            api_key="test_key",
-            verified=True
+        # The local password (from make_account) won't be used for auth
+        account = make_account("existinguser", "guest")
+        account.jellyfin_server = "Test Jellyfin"
+        account.jellyfin_user_id = "existing-user-id"
+        db.session.add(account)
+        db.session.flush()
+
+        # Mock successful Jellyfin response
+        requests_mock.post(
+            _JF_AUTH_URL,
+            json=_jf_payload("existing-user-id", "existinguser"),
+            status_code=200
         )
-        db.session.add(server)
-        
-        # Create an existing Jellyfin-linked account
-        account = AdminAccount(
+
+        # Attempt login with Jellyfin credentials
+        resp = client.post("/login", data={
+            "username": "existinguser",
+            "password": "jellyfinpass"
+        })
+
+        # Should redirect on successful login
+        assert resp.status_code in {302, 303}
+
+        # The same account is still there and still linked (usernames are
+        # unique, so it can't have been duplicated). Expire it first so the
+        # assertion reads what /login left in the database, not our own copy
+        db.session.expire(account)
+        assert_guest_account(
+            db.session.get(AdminAccount, account.id),
             username="existinguser",
-            role="guest",
-            jellyfin_server="Test Jellyfin",
-            jellyfin_user_id="existing-user-id"
+            user_id="existing-user-id",
         )
-        account.set_password("dummy-password")  # Won't be used for auth
-        db.session.add(account)
-        db.session.commit()
-        
-        # Mock successful Jellyfin response
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.POST,
-                "http://localhost:8096/Users/AuthenticateByName",
-                json={
-                    "User": {
-                        "Id": "existing-user-id",
-                        "Name": "existinguser",
-                        "HasPassword": True,
-                        "HasConfiguredPassword": True,
-                        "Policy": {}
-                    },
-                    "ServerId": "test-server-id",
-                    "AccessToken": "test-access-token"
-                },
-                status=200
-            )
-            
-            # Attempt login with Jellyfin credentials
-            resp = client.post("/login", data={
-                "username": "existinguser",
-                "password": "jellyfinpass"
-            })
-            
-            # Should redirect on successful login
-            assert resp.status_code in {302, 303}
-            
-            # Account should still exist and not be duplicated
-            accounts = AdminAccount.query.filter_by(username="existinguser").all()
-            assert len(accounts) == 1
-            assert accounts[0].jellyfin_server == "Test Jellyfin"
 
 
 def test_no_jellyfin_servers_configured(app):
@@ -211,7 +204,99 @@ def test_no_jellyfin_servers_configured(app):
     with app.app_context():
         # No Jellyfin servers in database
         success, server_name, user_info = authenticate_jellyfin_user("testuser", "testpass")
-        
+
         assert success is False
         assert server_name is None
-        assert user_info is None
\ No newline at end of file
+        assert user_info is None
+
+
+def test_server_cache_is_dropped_on_commit_not_flush(app):
+    """Test that the Jellyfin server list is only invalidated by a commit."""
+    with app.app_context():
+        assert _get_jellyfin_servers() == []
+
+        db.session.add(
+            MediaServer(
+                name="Rolled Back Jellyfin",
+                server_type="jellyfin",
+                url="http://localhost:18103",
+                api_key="test_key",
+            )
+        )
+        db.session.flush()
+        db.session.rollback()
+        assert _SERVER_CACHE.get("jellyfin") == []
+
+        db.session.add(
+            MediaServer(
+                name="Committed Jellyfin",
+                server_type="jellyfin",
+                url="http://localhost:18104",
+                api_key="test_key",
+            )
+        )
+        db.session.flush()
+        assert _get_jellyfin_servers() == []
+
+        db.session.commit()
+        assert _get_jellyfin_servers() == [
+            ("Committed Jellyfin", "http://localhost:18104")
+        ]
+
+
+@pytest.mark.usefixtures("jellyfin_server")
+def test_jellyfin_authentication_result_is_cached(app, requests_mock):
+    """Test that repeat logins within the TTL reuse the cached Jellyfin result.
+
+    Relies on conftest.reset_caches starting every test with an empty cache.
+    """
+    with app.app_context():
+        auth_mock = requests_mock.post(
+            _JF_AUTH_URL, json=_jf_payload(), status_code=200
+        )
+
+        success, _server_name, user_info = authenticate_jellyfin_user("testuser", "testpass")
+        assert success is True
+        assert auth_mock.call_count == 1
+
+        success, _server_name, user_info = authenticate_jellyfin_user("testuser", "testpass")
+        assert success is True
+        assert user_info["id"] == "test-user-id"
+        assert auth_mock.call_count == 1
+
+
+def test_unreachable_jellyfin_server_is_skipped_after_repeated_failures(requests_mock):
+    """Test that the circuit breaker stops contacting a server that keeps failing."""
+    auth_url = "http://localhost:18097/Users/AuthenticateByName"
+    auth_mock = requests_mock.post(auth_url, exc=RequestsConnectionError("down"))
+
+    for attempt in range(_BREAKER_THRESHOLD):
+        with pytest.raises(RequestsConnectionError):
+            _authenticate_against_server("http://localhost:18097", f"user{attempt}", "pass")
+
+    assert _authenticate_against_server("http://localhost:18097", "another", "pass") == (False, None)
+    assert auth_mock.call_count == _BREAKER_THRESHOLD
+
+
+def test_login_or_create_guest_does_not_take_over_local_account(app, make_account):
+    """Test that a Jellyfin login never links itself to an unrelated local account."""
+    with app.app_context():
+        local = make_account("localadmin", "admin")
+        db.session.add(local)
+        db.session.flush()
+
+        with patch(
+            "app.services.jellyfin_auth.authenticate_jellyfin_user",
+            return_value=(True, "Upsert Jellyfin", {"id": "jf-id"}),
+        ):
+            assert login_or_create_guest("localadmin", "jellyfinpass") is None
+
+            guest = login_or_create_guest("upsertguest", "jellyfinpass")
+            assert guest is not None
+            assert guest.role == "guest"
+            assert guest.jellyfin_server == "Upsert Jellyfin"
+            assert login_or_create_guest("upsertguest", "jellyfinpass").id == guest.id
+
+        db.session.refresh(local)
+        assert local.role == "admin"
+        assert local.jellyfin_server is None
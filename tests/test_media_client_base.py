@@ -0,0 +1,176 @@
+"""Tests for the shared MediaClient plumbing in client_base."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from app.extensions import db
+from app.models import MediaServer
+from app.services.media.client_base import MediaClient, _get_server_credentials
+from app.services.media.jellyfin import JellyfinClient
+
+
+class _HealthClient(MediaClient, abstract=True):
+    """Client whose health hooks count calls and return canned payloads."""
+
+    def __init__(self, server_info):
+        super().__init__(MediaServer(id=9001, url="http://health", api_key="k"))
+        self.server_info = server_info
+        self.calls = {"get_server_info": 0, "statistics": 0}
+
+    def get_server_info(self):
+        self.calls["get_server_info"] += 1
+        return self.server_info
+
+    def statistics(self):
+        self.calls["statistics"] += 1
+        return {"server_stats": self.server_info}
+
+
+def test_server_info_overrides_are_cached_as_deep_copies(app):
+    """Test that get_server_info overrides are memoised without opting in."""
+    client = _HealthClient({"version": "1.0", "sessions": {"active": 1}})
+
+    first = client.get_server_info()
+    first["sessions"]["active"] = 99
+
+    assert client.get_server_info() == {"version": "1.0", "sessions": {"active": 1}}
+    assert client.calls["get_server_info"] == 1
+
+
+def test_error_results_and_statistics_are_not_cached(app):
+    """Test that failures and statistics() always reach the server again."""
+    client = _HealthClient({"version": "Unknown", "error": "down"})
+
+    client.get_server_info()
+    client.get_server_info()
+    client.statistics()
+    client.statistics()
+
+    assert client.calls == {"get_server_info": 2, "statistics": 2}
+
+
+def test_readonly_statistics_reuse_the_last_statistics_result(app):
+    """Test that the readonly health path reuses a fresh statistics() result."""
+    client = _HealthClient({"version": "2.0"})
+
+    stats = client.statistics()
+
+    assert client.get_readonly_statistics() == stats
+    assert client.calls == {"get_server_info": 0, "statistics": 1}
+
+
+def test_server_credentials_follow_committed_edits(app):
+    """Test that cached credentials are replaced once an edit is committed."""
+    with app.app_context():
+        server = MediaServer(
+            name="Credentials Server",
+            server_type="emby",
+            url="http://localhost:18920",
+            api_key="old-key",
+        )
+        db.session.add(server)
+        db.session.commit()
+        assert _get_server_credentials("emby") == (
+            server.id,
+            "http://localhost:18920",
+            "old-key",
+        )
+
+        server.api_key = "new-key"
+        db.session.flush()
+        # Not committed yet: other sessions still see the old key
+        assert _get_server_credentials("emby")[2] == "old-key"
+
+        db.session.commit()
+        assert _get_server_credentials("emby")[2] == "new-key"
+
+
+def test_rest_clients_do_not_replay_cookies(app):
+    """Test that a Set-Cookie from one response is not sent on later requests."""
+    seen_cookies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen_cookies.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "SESSION=abc123; Path=/")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    # requests-mock bypasses the session's cookie jar, so use a real server
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with app.app_context():
+            client = JellyfinClient(
+                media_server=MediaServer(
+                    name="Cookie Server",
+                    server_type="jellyfin",
+                    url=f"http://127.0.0.1:{server.server_port}",
+                    api_key="cookie-key",
+                )
+            )
+            client.get("/System/Info")
+            client.get("/System/Info")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert seen_cookies == [None, None]
+
+
+def test_url_keeps_braces_in_the_base_url(app):
+    """Test that only the path template is formatted, never the base URL."""
+    with app.app_context():
+        client = JellyfinClient(
+            media_server=MediaServer(
+                name="Proxy Server",
+                server_type="jellyfin",
+                url="http://proxy.local/{jellyfin}/",
+                api_key="proxy-key",
+            )
+        )
+
+        assert (
+            client._url("/Items/{item_id}", item_id="abc")
+            == "http://proxy.local/{jellyfin}/Items/abc"
+        )
+
+
+def test_url_without_a_configured_server_url_raises_value_error(app):
+    """Test that a client with no URL yet fails clearly instead of on None."""
+    with app.app_context():
+        client = JellyfinClient(
+            media_server=MediaServer(
+                name="Unconfigured Server", server_type="jellyfin", api_key="key"
+            )
+        )
+
+        with pytest.raises(ValueError, match="URL is not configured"):
+            client._url("/Items/{item_id}", item_id="abc")
+        with pytest.raises(ValueError, match="URL is not configured"):
+            client.get("/System/Info")
+
+
+def test_load_all_warns_about_unsupported_server_types(app, caplog):
+    """Test that servers without a registered client are skipped loudly."""
+    with app.app_context():
+        db.session.add(
+            MediaServer(
+                name="Mystery Server",
+                server_type="mystery",
+                url="http://localhost:18922",
+                api_key="mystery-key",
+            )
+        )
+        db.session.flush()
+
+        assert MediaClient.load_all() == []
+        assert "Skipping server Mystery Server (mystery)" in caplog.text